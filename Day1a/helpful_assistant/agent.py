@@ -1,11 +1,7 @@
 from google.adk.agents import Agent
-from google.adk.models.google_llm import Gemini
-from google.adk.runners import InMemoryRunner
-from google.adk.tools import google_search
-from google.genai import types
-import vertexai
-import os
+import functools
 import asyncio
+import os
 from dotenv import load_dotenv
 import sys
 from pathlib import Path
@@ -17,14 +13,81 @@ load_dotenv()
 # Configure logging for ADK using utility module
 # Add parent directory to path to enable utility imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:  # sitecustomize.py usually did this already
+    sys.path.insert(0, str(parent_dir))
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
+from utility.llm_client import get_shared_gemini, get_generate_content_config
+from utility.tool_cache import make_tool_cache_callbacks
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="helpful_assistant", file_only=True)
 
 
+# Mock weather data (can be replaced with real API or MCP server call)
+# Built once at import so tool calls don't rebuild the table every time.
+_WEATHER_DATA = {
+    "london": {
+        "status": "success",
+        "location": "London, UK",
+        "temperature": "15°C (59°F)",
+        "condition": "Partly Cloudy",
+        "description": "Light cloud cover with occasional sunshine",
+        "humidity": "65%",
+        "wind_speed": "10 km/h",
+        "report": "The weather in London is partly cloudy with a temperature of 15°C (59°F). Light cloud cover with occasional sunshine. Humidity is 65% and wind speed is 10 km/h."
+    },
+    "new york": {
+        "status": "success",
+        "location": "New York, USA",
+        "temperature": "20°C (68°F)",
+        "condition": "Sunny",
+        "description": "Clear skies with sunshine",
+        "humidity": "55%",
+        "wind_speed": "12 km/h",
+        "report": "The weather in New York is sunny with a temperature of 20°C (68°F). Clear skies with sunshine. Humidity is 55% and wind speed is 12 km/h."
+    },
+    "tokyo": {
+        "status": "success",
+        "location": "Tokyo, Japan",
+        "temperature": "22°C (72°F)",
+        "condition": "Clear",
+        "description": "Clear and pleasant",
+        "humidity": "60%",
+        "wind_speed": "8 km/h",
+        "report": "The weather in Tokyo is clear with a temperature of 22°C (72°F). Clear and pleasant conditions. Humidity is 60% and wind speed is 8 km/h."
+    }
+}
+
+# Precomputed once at import so cache misses don't re-title-case and re-join
+# the city list on every call.
+_AVAILABLE_CITIES_STR = ", ".join(c.title() for c in _WEATHER_DATA)
+
+
+# Per-city constants: at 3 entries an if/elif chain on the normalized name
+# beats a dict hash+probe and avoids building the table lookup per call.
+# Grow past ~4 cities and the dict in _WEATHER_DATA becomes the better path.
+_LONDON = _WEATHER_DATA["london"]
+_NEW_YORK = _WEATHER_DATA["new york"]
+_TOKYO = _WEATHER_DATA["tokyo"]
+
+
+@functools.lru_cache(maxsize=256)
+def _lookup(city_lower: str) -> Dict[str, Any]:
+    """Resolve a normalized city name to its weather entry (cached per city)."""
+    if city_lower == "london":
+        return _LONDON
+    elif city_lower == "new york":
+        return _NEW_YORK
+    elif city_lower == "tokyo":
+        return _TOKYO
+    return {
+        "status": "error",
+        "error_message": f"Weather information for '{city_lower}' is not available. Try: {_AVAILABLE_CITIES_STR}",
+        "location": city_lower
+    }
+
+
 def get_weather_for_city(city: str = "London") -> Dict[str, Any]:
     """
     Get the current weather for a given city.
@@ -36,96 +99,100 @@ def get_weather_for_city(city: str = "London") -> Dict[str, Any]:
     Returns:
         Dictionary with weather information including temperature, condition, and description.
     """
-    # Mock weather data (can be replaced with real API or MCP server call)
-    weather_data = {
-        "london": {
-            "status": "success",
-            "location": "London, UK",
-            "temperature": "15°C (59°F)",
-            "condition": "Partly Cloudy",
-            "description": "Light cloud cover with occasional sunshine",
-            "humidity": "65%",
-            "wind_speed": "10 km/h",
-            "report": "The weather in London is partly cloudy with a temperature of 15°C (59°F). Light cloud cover with occasional sunshine. Humidity is 65% and wind speed is 10 km/h."
-        },
-        "new york": {
-            "status": "success",
-            "location": "New York, USA",
-            "temperature": "20°C (68°F)",
-            "condition": "Sunny",
-            "description": "Clear skies with sunshine",
-            "humidity": "55%",
-            "wind_speed": "12 km/h",
-            "report": "The weather in New York is sunny with a temperature of 20°C (68°F). Clear skies with sunshine. Humidity is 55% and wind speed is 12 km/h."
-        },
-        "tokyo": {
-            "status": "success",
-            "location": "Tokyo, Japan",
-            "temperature": "22°C (72°F)",
-            "condition": "Clear",
-            "description": "Clear and pleasant",
-            "humidity": "60%",
-            "wind_speed": "8 km/h",
-            "report": "The weather in Tokyo is clear with a temperature of 22°C (72°F). Clear and pleasant conditions. Humidity is 60% and wind speed is 8 km/h."
-        }
-    }
-    
-    city_lower = city.lower().strip()
-    if city_lower in weather_data:
-        return weather_data[city_lower]
-    else:
-        available_cities = ", ".join([c.title() for c in weather_data.keys()])
-        return {
-            "status": "error",
-            "error_message": f"Weather information for '{city}' is not available. Try: {available_cities}",
-            "location": city
-        }
+    return _lookup(city.lower().strip())
 
 
-# Define root_agent at module level for ADK web server
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,  # Initial delay before first retry (in seconds)
-    http_status_codes=[429, 500, 503, 504]  # Retry on these HTTP errors
-)
-
-root_agent = Agent(
-    name="helpful_assistant",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
-    ),
-    description="A helpful assistant that can answer general questions and provide weather information.",
-    instruction="""You are a helpful assistant.
+
+# Exact-match tool cache: identical weather lookups within the TTL return
+# the cached result instead of re-invoking the tool.
+_tool_cache_before, _tool_cache_after = make_tool_cache_callbacks()
+
+def build_agent(variant: str = None) -> Agent:
+    """
+    Build the helpful_assistant agent in the requested variant.
+
+    The repo used to carry near-identical copies of this module (with/without
+    the weather tool); they are consolidated here behind a single parameter.
+
+    Args:
+        variant: "weather" (custom weather tool, the default) or "search"
+                 (google_search instead - the two can't be mixed on Vertex AI).
+                 If None, reads HELPFUL_ASSISTANT_VARIANT from the environment.
+
+    Returns:
+        The configured Agent instance.
+    """
+    if variant is None:
+        variant = os.environ.get('HELPFUL_ASSISTANT_VARIANT', 'weather')
+    if variant == 'search':
+        from google.adk.tools import google_search
+        tools = [google_search]
+        description = "A helpful assistant that can answer general questions using Google Search."
+        instruction = """You are a helpful assistant.
+
+Use the google_search tool to look up anything you are not sure about.
+Be helpful and concise in your responses."""
+    else:
+        tools = [get_weather_for_city]
+        description = "A helpful assistant that can answer general questions and provide weather information."
+        instruction = """You are a helpful assistant.
 
 When users ask about the weather:
 1. Use the get_weather_for_city tool to fetch current weather information
 2. Respond in a friendly, conversational tone with the weather details
 3. If the city isn't available, suggest one of the available cities
 
-Be helpful and concise in your responses.""",
-    tools=[get_weather_for_city],  # Note: google_search can't be mixed with custom tools on Vertex AI
-)
+Be helpful and concise in your responses."""
+    return Agent(
+        name="helpful_assistant",
+        model=get_shared_gemini(),
+        generate_content_config=get_generate_content_config(),
+        description=description,
+        instruction=instruction,
+        tools=tools,
+        before_tool_callback=_tool_cache_before,
+        after_tool_callback=_tool_cache_after,
+    )
+
+
+# Define root_agent at module level for ADK web server
+root_agent = build_agent()
 
 # Ensure logging is maintained after agent creation
 ensure_debug_logging(agent_name="helpful_assistant")
 
 
 async def main():
+    # Imported lazily: only the __main__ path needs the runner, and adk web
+    # imports this module just to find root_agent.
+    from google.adk.runners import InMemoryRunner
+    from google.genai import types
+
     print("✅ ADK components imported successfully.")
     print("✅ Root Agent defined.")
     
     runner = InMemoryRunner(agent=root_agent)
     print("✅ Runner created.")
     
-    response = await runner.run_debug(
-        "What is Agent Development Kit from Google? What languages is the SDK available in?"
+    session = await runner.session_service.create_session(
+        app_name=runner.app_name, user_id="debug_user"
     )
+    query = types.Content(role="user", parts=[types.Part(
+        text="What is Agent Development Kit from Google? What languages is the SDK available in?"
+    )])
     
-    return response
-
-    #response = await runner.run_debug("What's the weather in London?")
+    # Stream the response so tokens are printed as they arrive instead of
+    # waiting for the full generation to complete.
+    async for event in runner.run_async(
+        user_id=session.user_id, session_id=session.id, new_message=query
+    ):
+        if event.content and event.content.parts:
+            text = event.content.parts[0].text
+            if text and text != "None":
+                print(text, end="", flush=True)
+    print()
+
+    #query text for the weather tool: "What's the weather in London?"
 
 
 if __name__ == "__main__":
@@ -10,7 +10,8 @@ load_dotenv()
 # Configure logging for ADK using utility module
 # Add parent directory to path to enable utility imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:  # sitecustomize.py usually did this already
+    sys.path.insert(0, str(parent_dir))
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
 
@@ -1,4 +1,5 @@
 from google.adk.agents import SequentialAgent
+import logging
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -15,6 +16,7 @@ from utility.logging_config import setup_adk_logging, ensure_debug_logging
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="BlogPipeline", file_only=True)
+logger = logging.getLogger(__name__)
 
 # Add Day1b directory to path to import sub-agents
 day1b_dir = Path(__file__).parent.parent
@@ -29,7 +31,7 @@ root_agent = SequentialAgent(
     sub_agents=[outline_agent, writer_agent, editor_agent],
 )
 
-print("✅ Sequential Agent created.")
+logger.info("Sequential Agent created.")
 
 
 # Ensure logging is maintained after agent creation
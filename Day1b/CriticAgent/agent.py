@@ -1,4 +1,5 @@
 from google.adk.agents.llm_agent import Agent
+import logging
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -10,24 +11,19 @@ load_dotenv()
 # Configure logging for ADK using utility module
 # Add parent directory to path to enable utility imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:  # sitecustomize.py usually did this already
+    sys.path.insert(0, str(parent_dir))
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
+from utility.llm_client import get_shared_gemini, get_generate_content_config
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="CriticAgent", file_only=True)
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,  # Initial delay before first retry (in seconds)
-    http_status_codes=[429, 500, 503, 504]  # Retry on these HTTP errors
-)
+logger = logging.getLogger(__name__)
 critic_agent = Agent(
     name="CriticAgent",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
-    ),
+    model=get_shared_gemini(),
+    generate_content_config=get_generate_content_config(),
     instruction="""You are a constructive story critic. Review the story provided below.
     Story: {current_story}
     
@@ -37,7 +33,7 @@ critic_agent = Agent(
     output_key="critique",  # Stores the feedback in the state.
 )
 
-print("✅ critic_agent created.")
+logger.info("critic_agent created.")
 
 # Ensure logging is maintained after agent creation
 ensure_debug_logging(agent_name="CriticAgent")
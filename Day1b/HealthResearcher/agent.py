@@ -1,8 +1,6 @@
-from google.adk.agents import Agent, SequentialAgent, ParallelAgent, LoopAgent
-from google.adk.models.google_llm import Gemini
-from google.adk.runners import InMemoryRunner
-from google.adk.tools import AgentTool, FunctionTool, google_search
-from google.genai import types
+from google.adk.agents import Agent
+from google.adk.tools import google_search
+import logging
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -13,31 +11,42 @@ load_dotenv()
 # Configure logging for ADK using utility module
 # Add parent directory to path to enable utility imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:  # sitecustomize.py usually did this already
+    sys.path.insert(0, str(parent_dir))
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
+from utility.llm_client import get_shared_gemini, get_generate_content_config
+from utility.semantic_cache import make_semantic_cache_callbacks
+from utility.tool_cache import make_tool_cache_callbacks
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="HealthResearcher", file_only=True)
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,  # Initial delay before first retry (in seconds)
-    http_status_codes=[429, 500, 503, 504]  # Retry on these HTTP errors
-)
+logger = logging.getLogger(__name__)
+
+# Semantic cache: paraphrased repeats of a research query skip the whole
+# search + LLM round trip and return the cached report.
+_cache_before, _cache_after = make_semantic_cache_callbacks(output_key="health_research")
+
+# Exact-match tool cache: identical google_search calls within the TTL
+# return the cached result instead of re-running the search.
+_tool_cache_before, _tool_cache_after = make_tool_cache_callbacks()
 health_researcher = Agent(
     name="HealthResearcher",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
-    ),
-    instruction="""Research recent medical breakthroughs. Include 3 significant advances,
+    model=get_shared_gemini(),
+    generate_content_config=get_generate_content_config(),
+    instruction="""Research recent medical breakthroughs. Issue 3 search queries covering
+distinct sub-topics (e.g. treatments, diagnostics, drug discovery) together in a single turn so
+they run in parallel, then synthesize the results. Include 3 significant advances,
 their practical applications, and estimated timelines. Keep the report concise (100 words).""",
     tools=[google_search],
     output_key="health_research",  # The result will be stored with this key.
+    before_agent_callback=_cache_before,
+    after_agent_callback=_cache_after,
+    before_tool_callback=_tool_cache_before,
+    after_tool_callback=_tool_cache_after,
 )
 
-print("✅ health_researcher created.")
+logger.info("health_researcher created.")
 root_agent = health_researcher
 
 # Ensure logging is maintained after agent creation
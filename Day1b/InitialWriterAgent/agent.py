@@ -1,4 +1,5 @@
 from google.adk.agents.llm_agent import Agent
+import logging
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -11,30 +12,82 @@ load_dotenv()
 # Configure logging for ADK using utility module
 # Add parent directory to path to enable utility imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:  # sitecustomize.py usually did this already
+    sys.path.insert(0, str(parent_dir))
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
+from utility.llm_client import DEFAULT_MODEL, get_shared_gemini, get_generate_content_config
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="InitialWriterAgent", file_only=True)
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,  # Initial delay before first retry (in seconds)
-    http_status_codes=[429, 500, 503, 504]  # Retry on these HTTP errors
-)
+logger = logging.getLogger(__name__)
+# The draft-writing instruction, shared by the online agent and the offline
+# batch path below so the two can't drift.
+_WRITER_INSTRUCTION = """Based on the user's prompt, write the first draft of a short story (around 100-150 words).
+    Output only the story text, with no introduction or explanation."""
+
 # This agent runs ONCE at the beginning to create the first draft.
 initial_writer_agent = Agent(
     name="InitialWriterAgent",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
-    ),
-    instruction="""Based on the user's prompt, write the first draft of a short story (around 100-150 words).
-    Output only the story text, with no introduction or explanation.""",
+    model=get_shared_gemini(),
+    generate_content_config=get_generate_content_config(),
+    instruction=_WRITER_INSTRUCTION,
     output_key="current_story",  # Stores the first draft in the state.
 )
 
-print("✅ initial_writer_agent created.")
+logger.info("initial_writer_agent created.")
 # Ensure logging is maintained after agent creation
 ensure_debug_logging(agent_name="InitialWriterAgent")
+
+_BATCH_POLL_SECONDS = 30
+
+
+def run_batch(prompts):
+    """
+    Generate first drafts for many prompts via the Gemini batch API.
+
+    For offline workloads (dataset generation, evaluation sweeps) the online
+    root_agent would issue one request per prompt; batch prediction submits
+    them as a single job at the discounted batch token rate and with much
+    higher throughput. The online root_agent is untouched - select this path
+    explicitly (e.g. AGENT_MODE=batch in the calling script).
+
+    Args:
+        prompts: List of story prompts, one per draft.
+
+    Returns:
+        List of draft stories, in the same order as prompts (None for rows
+        the job failed to generate).
+    """
+    import time
+    from google import genai
+
+    client = genai.Client()
+    job = client.batches.create(
+        model=DEFAULT_MODEL,
+        src=[
+            {
+                "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                "config": {"system_instruction": {"parts": [{"text": _WRITER_INSTRUCTION}]}},
+            }
+            for prompt in prompts
+        ],
+        config={"display_name": "initial-writer-batch"},
+    )
+    logger.info("batch job %s submitted with %d prompts", job.name, len(prompts))
+
+    while job.state.name not in (
+        'JOB_STATE_SUCCEEDED', 'JOB_STATE_FAILED', 'JOB_STATE_CANCELLED'
+    ):
+        time.sleep(_BATCH_POLL_SECONDS)
+        job = client.batches.get(name=job.name)
+
+    if job.state.name != 'JOB_STATE_SUCCEEDED':
+        raise RuntimeError(f"Batch job {job.name} ended in state {job.state.name}")
+
+    stories = []
+    for inlined in job.dest.inlined_responses:
+        response = getattr(inlined, 'response', None)
+        stories.append(response.text if response is not None else None)
+    return stories
+
@@ -1,9 +1,6 @@
-from google.adk.agents import Agent, SequentialAgent, ParallelAgent, LoopAgent
-from google.adk.models.google_llm import Gemini
-from google.adk.runners import InMemoryRunner
-from google.adk.tools import AgentTool, FunctionTool, google_search
-from google.genai import types
+from google.adk.agents import Agent
 
+import logging
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -14,36 +11,43 @@ load_dotenv()
 # Configure logging for ADK using utility module
 # Add parent directory to path to enable utility imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:  # sitecustomize.py usually did this already
+    sys.path.insert(0, str(parent_dir))
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
+from utility.llm_client import (
+    get_shared_gemini,
+    get_generate_content_config,
+    get_inline_instruction,
+)
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="OutlineAgent", file_only=True)
+logger = logging.getLogger(__name__)
 # Define root_agent at module level for ADK web server
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,  # Initial delay before first retry (in seconds)
-    http_status_codes=[429, 500, 503, 504]  # Retry on these HTTP errors
-)
 
-# Outline Agent: Creates the initial blog post outline.
-outline_agent = Agent(
-    name="OutlineAgent",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
-    ),
-    instruction="""Create a blog outline for the given topic with:
+# The instruction is hoisted so it can double as the shared KV-cache prefix
+# when context caching is enabled (ADK_CONTEXT_CACHE=1).
+_INSTRUCTION = """Create a blog outline for the given topic with:
     1. A catchy headline
     2. An introduction hook
     3. 3-5 main sections with 2-3 bullet points for each
-    4. A concluding thought""",
+    4. A concluding thought"""
+
+_GEN_CONFIG = get_generate_content_config(instruction=_INSTRUCTION)
+
+# Outline Agent: Creates the initial blog post outline.
+outline_agent = Agent(
+    name="OutlineAgent",
+    model=get_shared_gemini(),
+    generate_content_config=_GEN_CONFIG,
+    # Empty when _GEN_CONFIG carries the instruction as cachedContent: the
+    # API rejects cached_content combined with system_instruction.
+    instruction=get_inline_instruction(_INSTRUCTION, _GEN_CONFIG),
     output_key="blog_outline",  # The result of this agent will be stored in the session state with this key.
 )
 
-print("✅ outline_agent created.")
+logger.info("outline_agent created.")
 root_agent = outline_agent
 # Ensure logging is maintained after agent creation
 ensure_debug_logging(agent_name="OutlineAgent")
@@ -3,6 +3,7 @@ from google.adk.models.google_llm import Gemini
 from google.adk.runners import InMemoryRunner
 from google.adk.tools import AgentTool, FunctionTool, google_search
 from google.genai import types
+import logging
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -13,12 +14,14 @@ load_dotenv()
 # Configure logging for ADK using utility module
 # Add parent directory to path to enable utility imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:  # sitecustomize.py usually did this already
+    sys.path.insert(0, str(parent_dir))
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="ParallelResearchTeam", file_only=True)
+logger = logging.getLogger(__name__)
 
 from TechResearcher.agent import tech_researcher
 from HealthResearcher.agent import health_researcher
@@ -36,7 +39,7 @@ root_agent = SequentialAgent(
     sub_agents=[parallel_research_team, aggregator_agent],
 )
 
-print("✅ Parallel and Sequential Agents created.")
+logger.info("Parallel and Sequential Agents created.")
 
 # Ensure logging is maintained after agent creation
 ensure_debug_logging(agent_name="ParallelResearchTeam")
@@ -1,4 +1,5 @@
 from google.adk.agents.llm_agent import Agent
+import logging
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -11,12 +12,15 @@ load_dotenv()
 # Configure logging for ADK using utility module
 # Add parent directory to path to enable utility imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:  # sitecustomize.py usually did this already
+    sys.path.insert(0, str(parent_dir))
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
+from utility.llm_client import get_shared_gemini, get_generate_content_config
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="RefinerAgent", file_only=True)
+logger = logging.getLogger(__name__)
 
 # This is the function that the RefinerAgent will call to exit the loop.
 # It must be defined BEFORE it's used in the FunctionTool.
@@ -24,19 +28,11 @@ def exit_loop():
     """Call this function ONLY when the critique is 'APPROVED', indicating the story is finished and no more changes are needed."""
     return {"status": "approved", "message": "Story approved. Exiting refinement loop."}
 
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,  # Initial delay before first retry (in seconds)
-    http_status_codes=[429, 500, 503, 504]  # Retry on these HTTP errors
-)
 # This agent refines the story based on critique OR calls the exit_loop function.
 refiner_agent = Agent(
     name="RefinerAgent",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
-    ),
+    model=get_shared_gemini(),
+    generate_content_config=get_generate_content_config(),
     instruction="""You are a story refiner. You have a story draft and critique.
     
     Story Draft: {current_story}
@@ -51,7 +47,7 @@ refiner_agent = Agent(
     ],  # The tool is now correctly initialized with the function reference.
 )
 
-print("✅ refiner_agent created.")
-print("✅ exit_loop function created.")
+logger.info("refiner_agent created.")
+logger.info("exit_loop function created.")
 # Ensure logging is maintained after agent creation
 ensure_debug_logging(agent_name="RefinerAgent")
\ No newline at end of file
@@ -7,6 +7,7 @@ import vertexai
 import os
 import asyncio
 from dotenv import load_dotenv
+import logging
 import sys
 from pathlib import Path
 
@@ -16,37 +17,46 @@ load_dotenv()
 # Configure logging for ADK using utility module
 # Add parent directory to path to enable utility imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:  # sitecustomize.py usually did this already
+    sys.path.insert(0, str(parent_dir))
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
+from utility.llm_client import get_shared_gemini, get_generate_content_config
+from utility.semantic_cache import make_semantic_cache_callbacks
+from utility.tool_cache import make_tool_cache_callbacks
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="ResearchAgent", file_only=True)
+logger = logging.getLogger(__name__)
+
+# Semantic cache: paraphrased repeats of a research topic skip the whole
+# search + LLM round trip and return the cached findings.
+_cache_before, _cache_after = make_semantic_cache_callbacks(output_key="research_findings")
+
+# Exact-match tool cache: identical google_search calls within the TTL
+# return the cached result instead of re-running the search.
+_tool_cache_before, _tool_cache_after = make_tool_cache_callbacks()
 
 # Define root_agent at module level for ADK web server
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,  # Initial delay before first retry (in seconds)
-    http_status_codes=[429, 500, 503, 504]  # Retry on these HTTP errors
-)
 
 research_agent = Agent(
     name="ResearchAgent",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
-    ),
+    model=get_shared_gemini(),
+    generate_content_config=get_generate_content_config(),
     instruction="""You are a specialized research agent. Your only job is to use the
     google_search tool to find 2-3 pieces of relevant information on the given topic and present the findings with citations.""",
     tools=[google_search],
     output_key="research_findings",  # The result of this agent will be stored in the session state with this key.
+    before_agent_callback=_cache_before,
+    after_agent_callback=_cache_after,
+    before_tool_callback=_tool_cache_before,
+    after_tool_callback=_tool_cache_after,
 )
 
 # Expose as root_agent for ADK to find when running standalone
 root_agent = research_agent
 
-print("✅ research_agent created.")
+logger.info("research_agent created.")
 
 # Ensure logging is maintained after agent creation
 ensure_debug_logging(agent_name="ResearchAgent")
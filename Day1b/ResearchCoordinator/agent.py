@@ -1,12 +1,7 @@
 from google.adk.agents.llm_agent import Agent
-from google.adk.models.google_llm import Gemini
-from google.adk.runners import InMemoryRunner
-from google.adk.tools import AgentTool, FunctionTool, google_search
-from google.genai import types
-import vertexai
-import os
-import asyncio
+from google.adk.tools import AgentTool
 from dotenv import load_dotenv
+import logging
 import sys
 from pathlib import Path
 
@@ -16,9 +11,11 @@ load_dotenv()
 # Configure detailed logging for ADK using utility module
 # Add parent directory to path to enable utility imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:  # sitecustomize.py usually did this already
+    sys.path.insert(0, str(parent_dir))
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
+from utility.llm_client import get_shared_gemini, get_generate_content_config
 
 # Setup logging - this enables DEBUG level logging to capture:
 # - Events and traces
@@ -27,40 +24,41 @@ from utility.logging_config import setup_adk_logging, ensure_debug_logging
 # - Metadata and model interactions
 # - HTTP request/response details
 setup_adk_logging(agent_name="ResearchCoordinator", file_only=True)
+logger = logging.getLogger(__name__)
 
-# Import the sub-agents from their respective modules
-# Add parent directory to path to enable imports
-parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
-
-from ResearchAgent import research_agent
-from SummarizerAgent import summarizer_agent
+# Import the sub-agents via their package paths (the repo root is already on
+# sys.path), so the import system's cached finder resolves them directly
+# instead of walking a mutated sys.path for top-level names.
+from Day1b.ResearchAgent.agent import research_agent
+from Day1b.SummarizerAgent.agent import summarizer_agent
 
 # Define root_agent at module level for ADK web server
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,  # Initial delay before first retry (in seconds)
-    http_status_codes=[429, 500, 503, 504]  # Retry on these HTTP errors
-)
+
+# The instruction is hoisted so it can double as the shared KV-cache prefix
+# when context caching is enabled (ADK_CONTEXT_CACHE=1).
+_INSTRUCTION = """You are a research coordinator. Your goal is to answer the user's query by orchestrating a workflow.
+1. First, break the user's query into its independent sub-topics. Call the `ResearchAgent` tool once per sub-topic,
+   issuing all of those calls together in a single response so they run in parallel. For a single-topic query, one call is enough.
+2. Next, after all research findings have been received, you MUST call the `SummarizerAgent` tool once on the combined results to create a concise summary.
+3. Finally, present the final summary clearly to the user as your response."""
 
 # Root Coordinator: Orchestrates the workflow by calling the sub-agents as tools.
 root_agent = Agent(
     name="ResearchCoordinator",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
+    model=get_shared_gemini(),
+    # has_tools: the API rejects cached_content combined with tool
+    # declarations, so this agent keeps its instruction inline even when
+    # ADK_CONTEXT_CACHE=1 (only the latency knob applies here).
+    generate_content_config=get_generate_content_config(
+        instruction=_INSTRUCTION, has_tools=True
     ),
     # This instruction tells the root agent HOW to use its tools (which are the other agents).
-    instruction="""You are a research coordinator. Your goal is to answer the user's query by orchestrating a workflow.
-1. First, you MUST call the `ResearchAgent` tool to find relevant information on the topic provided by the user.
-2. Next, after receiving the research findings, you MUST call the `SummarizerAgent` tool to create a concise summary.
-3. Finally, present the final summary clearly to the user as your response.""",
+    instruction=_INSTRUCTION,
     # We wrap the sub-agents in `AgentTool` to make them callable tools for the root agent.
     tools=[AgentTool(research_agent), AgentTool(summarizer_agent)],
 )
 
-print("✅ root_agent created.")
+logger.info("root_agent created.")
 
 # Ensure DEBUG logging is maintained after agent creation
 # ADK might reset logging, so we re-apply DEBUG level
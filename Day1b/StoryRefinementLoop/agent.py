@@ -1,4 +1,5 @@
 from google.adk.agents.llm_agent import Agent
+import logging
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -9,12 +10,14 @@ load_dotenv()
 # Configure logging for ADK using utility module
 # Add parent directory to path to enable utility imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:  # sitecustomize.py usually did this already
+    sys.path.insert(0, str(parent_dir))
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="StoryRefinementLoop", file_only=True)
+logger = logging.getLogger(__name__)
 from CriticAgent.agent import critic_agent
 from RefinerAgent.agent import refiner_agent
 from InitialWriterAgent.agent import initial_writer_agent
@@ -32,7 +35,7 @@ root_agent = SequentialAgent(
     sub_agents=[initial_writer_agent, story_refinement_loop],
 )
 
-print("✅ Loop and Sequential Agents created.")
+logger.info("Loop and Sequential Agents created.")
 
 # Ensure logging is maintained after agent creation
 ensure_debug_logging(agent_name="StoryRefinementLoop")
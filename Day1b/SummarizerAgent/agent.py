@@ -7,6 +7,7 @@ import vertexai
 import os
 import asyncio
 from dotenv import load_dotenv
+import logging
 import sys
 from pathlib import Path
 
@@ -16,26 +17,21 @@ load_dotenv()
 # Configure logging for ADK using utility module
 # Add parent directory to path to enable utility imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:  # sitecustomize.py usually did this already
+    sys.path.insert(0, str(parent_dir))
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
+from utility.llm_client import get_shared_gemini, get_generate_content_config
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="SummarizerAgent", file_only=True)
+logger = logging.getLogger(__name__)
 
 # Define root_agent at module level for ADK web server
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,  # Initial delay before first retry (in seconds)
-    http_status_codes=[429, 500, 503, 504]  # Retry on these HTTP errors
-)
 summarizer_agent = Agent(
     name="SummarizerAgent",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
-    ),
+    model=get_shared_gemini(),
+    generate_content_config=get_generate_content_config(),
     # The instruction is modified to request a bulleted list for a clear output format.
     instruction="""Read the provided research findings: {research_findings}
 Create a concise summary as a bulleted list with 3-5 key points.""",
@@ -45,7 +41,7 @@ Create a concise summary as a bulleted list with 3-5 key points.""",
 # Expose as root_agent for ADK to find when running standalone
 root_agent = summarizer_agent
 
-print("✅ summarizer_agent created.")
+logger.info("summarizer_agent created.")
 
 # Ensure logging is maintained after agent creation
 ensure_debug_logging(agent_name="SummarizerAgent")
\ No newline at end of file
@@ -3,6 +3,7 @@ from google.adk.models.google_llm import Gemini
 from google.adk.runners import InMemoryRunner
 from google.adk.tools import AgentTool, FunctionTool, google_search
 from google.genai import types
+import logging
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -13,34 +14,29 @@ load_dotenv()
 # Configure logging for ADK using utility module
 # Add parent directory to path to enable utility imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:  # sitecustomize.py usually did this already
+    sys.path.insert(0, str(parent_dir))
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
+from utility.llm_client import get_shared_gemini, get_generate_content_config
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="WriterAgent", file_only=True)
+logger = logging.getLogger(__name__)
 # Define root_agent at module level for ADK web server
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,  # Initial delay before first retry (in seconds)
-    http_status_codes=[429, 500, 503, 504]  # Retry on these HTTP errors
-)
 
 # Writer Agent: Writes the full blog post based on the outline from the previous agent.
 writer_agent = Agent(
     name="WriterAgent",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
-    ),
+    model=get_shared_gemini(),
+    generate_content_config=get_generate_content_config(),
     # The `{blog_outline}` placeholder automatically injects the state value from the previous agent's output.
     instruction="""Following this outline strictly: {blog_outline}
     Write a brief, 200 to 300-word blog post with an engaging and informative tone.""",
     output_key="blog_draft",  # The result of this agent will be stored with this key.
 )
 
-print("✅ writer_agent created.")
+logger.info("writer_agent created.")
 root_agent = writer_agent
 # Ensure logging is maintained after agent creation
 ensure_debug_logging(agent_name="WriterAgent")
@@ -31,6 +31,21 @@ from Day2a.CurrencyAgent.agent import (
     enhanced_currency_agent,
 )
 
+async def stream_query(runner: InMemoryRunner, query: str) -> None:
+    """Stream an agent response to stdout as tokens arrive."""
+    session = await runner.session_service.create_session(
+        app_name=runner.app_name, user_id="demo_user"
+    )
+    message = types.Content(role="user", parts=[types.Part(text=query)])
+    async for event in runner.run_async(
+        user_id=session.user_id, session_id=session.id, new_message=message
+    ):
+        if event.content and event.content.parts:
+            text = event.content.parts[0].text
+            if text and text != "None":
+                print(text, end="", flush=True)
+    print()
+
 
 async def test_basic_currency_agent():
     """Test the basic currency agent."""
@@ -45,7 +60,9 @@ async def test_basic_currency_agent():
     print("🤖 Agent Response:")
     print("-" * 60)
 
-    response = await runner.run_debug(query)
+    # Stream partial output so the user sees tokens at first-token time
+    # instead of waiting for the full completion.
+    await stream_query(runner, query)
     print("-" * 60)
 
 
@@ -62,7 +79,7 @@ async def test_enhanced_currency_agent():
     print("🤖 Agent Response:")
     print("-" * 60)
 
-    response = await runner.run_debug(query)
+    await stream_query(runner, query)
     print("-" * 60)
 
 
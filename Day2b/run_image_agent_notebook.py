@@ -7,21 +7,35 @@ Copy this code into a Jupyter notebook cell to run the agent interactively.
 # Cell 1: Import and setup
 import asyncio
 import base64
-from pathlib import Path
+import binascii
+import os
 import sys
 
 # Add project root to path
-project_root = Path().resolve().parent
-sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.getcwd())
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from google.adk.runners import InMemoryRunner
 from Day2b.image_agent.agent import image_agent
 from IPython.display import display, Image as IPImage
 
+# C base64 decoder without the pure-Python wrapper, bound once for the loop
+_b64decode = binascii.a2b_base64
+
 # Cell 2: Run agent and process response
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def get_runner() -> InMemoryRunner:
+    """Build the runner once; re-running the cell reuses it."""
+    return InMemoryRunner(agent=image_agent)
+
+
 async def run_agent(query: str):
     """Run the agent with a query and return the response."""
-    runner = InMemoryRunner(agent=image_agent)
+    runner = get_runner()
     response = await runner.run_debug(query)
     return response
 
@@ -37,5 +51,5 @@ for event in response:
             if hasattr(part, "function_response") and part.function_response:
                 for item in part.function_response.response.get("content", []):
                     if item.get("type") == "image":
-                        display(IPImage(data=base64.b64decode(item["data"])))
+                        display(IPImage(data=_b64decode(item["data"].encode("ascii", "ignore"))))
 
@@ -19,21 +19,39 @@ async def main():
     print("Shipping Agent - Long-Running Operations Demo")
     print("=" * 60)
     
-    # Demo 1: Small order - auto-approved
     print("\n📦 Demo 1: Small Order (Auto-Approved)")
-    await run_shipping_workflow("Ship 3 containers to Singapore")
+    print("📦 Demo 2: Large Order (Approved)")
+    print("📦 Demo 3: Large Order (Rejected)")
     
-    # Demo 2: Large order - approved
-    print("\n📦 Demo 2: Large Order (Approved)")
-    await run_shipping_workflow("Ship 10 containers to Rotterdam", auto_approve=True)
-    
-    # Demo 3: Large order - rejected
-    print("\n📦 Demo 3: Large Order (Rejected)")
-    await run_shipping_workflow("Ship 8 containers to Los Angeles", auto_approve=False)
+    # The demos are independent workflows, so run them concurrently and let
+    # their network waits overlap (output from the three may interleave)
+    await asyncio.gather(
+        run_shipping_workflow("Ship 3 containers to Singapore"),
+        run_shipping_workflow("Ship 10 containers to Rotterdam", auto_approve=True),
+        run_shipping_workflow("Ship 8 containers to Los Angeles", auto_approve=False),
+    )
     
     print("\n✅ All demos completed!")
 
 
+_loop = None
+
+
+def run(coro):
+    """
+    Run a coroutine on a persistent module-level event loop.
+
+    asyncio.run builds and tears down a fresh loop (plus its default
+    executor) on every call - setup that repeated notebook invocations of
+    run(main()) have no reason to re-pay.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop.run_until_complete(coro)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
 
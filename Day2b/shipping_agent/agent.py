@@ -1,7 +1,7 @@
 import uuid
 from google.genai import types
+import os
 import sys
-from pathlib import Path
 from dotenv import load_dotenv
 
 from google.adk.agents import LlmAgent
@@ -24,10 +24,12 @@ load_dotenv()
 
 # Configure logging for ADK using utility module
 # Add project root to path to enable utility imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
+from utility.retry_config import RETRY_CONFIG
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="shipping_agent", file_only=True)
@@ -91,15 +93,9 @@ def place_shipping_order(
 
 
 print("✅ Long-running functions created!")
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,
-    http_status_codes=[429, 500, 503, 504],  # Retry on these HTTP errors
-)
 shipping_agent = LlmAgent(
     name="shipping_agent",
-    model=Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config),
+    model=Gemini(model="gemini-2.5-flash-lite", retry_options=RETRY_CONFIG),
     instruction="""You are a shipping coordinator assistant.
   
   When users request to ship containers:
@@ -0,0 +1,86 @@
+"""
+Shared interactive loop for the Day3a run scripts.
+
+The three run_*_agent.py scripts carried byte-for-byte identical input
+loops. Keeping one copy means the CPython specializer (PEP 659) warms the
+hot loop once instead of three times, and the scripts shrink to their
+banners plus a single call.
+"""
+
+import sys
+
+from _streaming import prefetch
+from google.genai import types
+
+# Interned once so the per-event comparison is a pointer check first
+_NONE = "None"
+
+
+async def interactive(runner, user_id, default_session_id="default", show_turns=False):
+    """
+    Run the shared interactive session loop against a runner.
+
+    Args:
+        runner: The ADK Runner to stream turns through.
+        user_id: User ID passed to runner.run_async.
+        default_session_id: Session ID used when the user presses Enter.
+        show_turns: If True, print a [Turn N] marker before each turn.
+    """
+    session_id = (
+        input(f"Enter session ID (or press Enter for '{default_session_id}'): ").strip()
+        or default_session_id
+    )
+    print(f"\nUsing session: {session_id}")
+    print("Type 'quit' or 'exit' to end the conversation\n")
+
+    # Bind the write/flush methods once; print(..., flush=True) per chunk
+    # would re-look them up and flush on every call
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    turn_count = 0
+
+    while True:
+        user_input = input("You > ").strip()
+
+        if user_input.lower() in ['quit', 'exit', 'q']:
+            print("\nGoodbye!")
+            break
+
+        if not user_input:
+            continue
+
+        turn_count += 1
+        if show_turns:
+            print(f"[Turn {turn_count}]")
+
+        # Convert to ADK Content format
+        # model_construct skips pydantic validation - the fields are
+        # known-good literals, so there is nothing to validate per turn
+        query = types.Content.model_construct(
+            role="user", parts=[types.Part.model_construct(text=user_input)]
+        )
+
+        write("\nAgent > ")
+        flush()
+
+        # Stream the agent's response, prefetching the next event while the
+        # current one is handled. Chunks are accumulated and written with a
+        # single join+write per turn instead of a print/flush per event.
+        buf = []
+        async for event in prefetch(runner.run_async(
+            user_id=user_id,
+            session_id=session_id,
+            new_message=query
+        )):
+            content = event.content
+            parts = content and content.parts
+            if not parts:
+                continue
+            text = parts[0].text
+            if text is None or text == _NONE:
+                continue
+            buf.append(text)
+
+        write("".join(buf))
+        write("\n\n")
+        flush()
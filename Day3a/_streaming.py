@@ -0,0 +1,37 @@
+"""
+Streaming helpers for the Day3a interactive scripts.
+"""
+
+import asyncio
+
+
+async def prefetch(aiterable):
+    """
+    Iterate an async stream while already awaiting the next item.
+
+    The interactive loops consume runner.run_async events serially: await
+    the event, then print it. Requesting event K+1 before handling event K
+    overlaps the network wait with the print/flush work, trimming tail
+    latency on chatty event streams.
+
+    Args:
+        aiterable: Any async iterable (e.g. runner.run_async(...)).
+
+    Yields:
+        The items of aiterable, in order.
+    """
+    iterator = aiterable.__aiter__()
+    pending = asyncio.ensure_future(iterator.__anext__())
+    try:
+        while True:
+            try:
+                item = await pending
+            except StopAsyncIteration:
+                pending = None
+                return
+            # Kick off the next fetch before handing the item to the caller
+            pending = asyncio.ensure_future(iterator.__anext__())
+            yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
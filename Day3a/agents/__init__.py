@@ -1,17 +1,30 @@
 """
 Day3a Session Management Agents
+
+Importing this package is cheap: each submodule pulls in google.adk,
+builds a runner, and may create a database engine, so submodules are only
+imported when one of their exports is first accessed (PEP 562 lazy loading).
 """
 
-from .session_agent import runner as session_runner, root_agent as session_agent
-from .compaction_agent import runner as compaction_runner, chatbot_agent as compaction_agent
-from .basic_session_agent import runner as basic_runner, root_agent as basic_agent
+import importlib
+
+_LAZY_EXPORTS = {
+    'session_runner': ('.session_agent', 'runner'),
+    'session_agent': ('.session_agent', 'root_agent'),
+    'compaction_runner': ('.compaction_agent', 'runner'),
+    'compaction_agent': ('.compaction_agent', 'chatbot_agent'),
+    'basic_runner': ('.basic_session_agent', 'runner'),
+    'basic_agent': ('.basic_session_agent', 'root_agent'),
+}
+
+__all__ = list(_LAZY_EXPORTS)
 
-__all__ = [
-    'session_runner',
-    'session_agent',
-    'compaction_runner',
-    'compaction_agent',
-    'basic_runner',
-    'basic_agent',
-]
 
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __package__), attr)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
@@ -9,31 +9,47 @@ from google.adk.models.google_llm import Gemini
 from google.adk.sessions import InMemorySessionService
 from google.adk.runners import Runner
 from google.genai import types
+import logging
 import os
 from dotenv import load_dotenv
 import sys
-from pathlib import Path
 
 # Load environment variables
 load_dotenv()
 
 # Add parent directory to path
-parent_dir = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
 try:
     from utility.logging_config import setup_adk_logging, ensure_debug_logging
     setup_adk_logging(agent_name="basic_session_agent", file_only=True)
 except ImportError:
-    print("Warning: Could not import logging config")
-
-# Configure retry options
-retry_config = types.HttpRetryOptions(
-    attempts=5,
-    exp_base=7,
-    initial_delay=1,
-    http_status_codes=[429, 500, 503, 504],
-)
+    logging.getLogger(__name__).warning("Could not import logging config")
+
+logger = logging.getLogger(__name__)
+
+# Shared memoized Gemini model: one httpx client, connection pool, and auth
+# handshake across every agent that imports together (falls back to a local
+# instance when utility is absent)
+try:
+    from utility.llm_client import get_shared_gemini
+except ImportError:
+    import functools
+
+    @functools.lru_cache(maxsize=None)
+    def get_shared_gemini(model):
+        return Gemini(
+            model=model,
+            retry_options=types.HttpRetryOptions(
+                attempts=5,
+                exp_base=2,
+                initial_delay=0.5,
+                max_delay=30,
+                http_status_codes=[429, 500, 503, 504],
+            ),
+        )
 
 # Configuration
 APP_NAME = os.getenv("APP_NAME", "basic_session_app")
@@ -41,7 +57,7 @@ MODEL_NAME = os.getenv("AGENT_MODEL", "gemini-2.5-flash-lite")
 
 # Create agent
 root_agent = Agent(
-    model=Gemini(model=MODEL_NAME, retry_options=retry_config),
+    model=get_shared_gemini(MODEL_NAME),
     name="text_chat_bot",
     description="A simple text chatbot with session management",
 )
@@ -56,8 +72,8 @@ runner = Runner(
     session_service=session_service
 )
 
-print(f"✅ Basic session agent initialized!")
-print(f"   - App: {APP_NAME}")
-print(f"   - Model: {MODEL_NAME}")
-print(f"   - Session Service: InMemory (temporary)")
+logger.info(
+    "Basic session agent initialized: app=%s model=%s session_service=InMemory",
+    APP_NAME, MODEL_NAME,
+)
 
@@ -12,31 +12,47 @@ from google.adk.sessions import DatabaseSessionService, InMemorySessionService
 from google.adk.runners import Runner
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
+import logging
 import os
 from dotenv import load_dotenv
 import sys
-from pathlib import Path
 
 # Load environment variables
 load_dotenv()
 
 # Add parent directory to path for utility imports
-parent_dir = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
 try:
     from utility.logging_config import setup_adk_logging, ensure_debug_logging
     setup_adk_logging(agent_name="session_agent", file_only=True)
 except ImportError:
-    print("Warning: Could not import logging config")
-
-# Configure retry options
-retry_config = types.HttpRetryOptions(
-    attempts=5,
-    exp_base=7,
-    initial_delay=1,
-    http_status_codes=[429, 500, 503, 504],
-)
+    logging.getLogger(__name__).warning("Could not import logging config")
+
+logger = logging.getLogger(__name__)
+
+# Shared memoized Gemini model: one httpx client, connection pool, and auth
+# handshake across every agent that imports together (falls back to a local
+# instance when utility is absent)
+try:
+    from utility.llm_client import get_shared_gemini
+except ImportError:
+    import functools
+
+    @functools.lru_cache(maxsize=None)
+    def get_shared_gemini(model):
+        return Gemini(
+            model=model,
+            retry_options=types.HttpRetryOptions(
+                attempts=5,
+                exp_base=2,
+                initial_delay=0.5,
+                max_delay=30,
+                http_status_codes=[429, 500, 503, 504],
+            ),
+        )
 
 # Configuration
 APP_NAME = os.getenv("APP_NAME", "session_app")
@@ -70,7 +86,7 @@ def retrieve_userinfo(tool_context: ToolContext) -> Dict[str, Any]:
 
 # Create agent with session state tools
 root_agent = LlmAgent(
-    model=Gemini(model=MODEL_NAME, retry_options=retry_config),
+    model=get_shared_gemini(MODEL_NAME),
     name="session_chat_bot",
     description="""A text chatbot with session management capabilities.
     Tools for managing user context:
@@ -86,10 +102,10 @@ DB_URL = os.getenv("DB_URL", "sqlite:///session_data.db")
 
 if SESSION_SERVICE_TYPE == "database":
     session_service = DatabaseSessionService(db_url=DB_URL)
-    print(f"✅ Using DatabaseSessionService: {DB_URL}")
+    logger.info("Using DatabaseSessionService: %s", DB_URL)
 else:
     session_service = InMemorySessionService()
-    print("✅ Using InMemorySessionService (temporary)")
+    logger.info("Using InMemorySessionService (temporary)")
 
 # Create runner
 runner = Runner(
@@ -98,8 +114,8 @@ runner = Runner(
     session_service=session_service
 )
 
-print(f"✅ Session agent initialized!")
-print(f"   - App: {APP_NAME}")
-print(f"   - Model: {MODEL_NAME}")
-print(f"   - Session Service: {session_service.__class__.__name__}")
+logger.info(
+    "Session agent initialized: app=%s model=%s session_service=%s",
+    APP_NAME, MODEL_NAME, session_service.__class__.__name__,
+)
 
@@ -12,31 +12,47 @@ from google.adk.sessions import InMemorySessionService
 from google.adk.memory import InMemoryMemoryService
 from google.adk.tools import preload_memory
 from google.genai import types
+import logging
 import os
 from dotenv import load_dotenv
 import sys
-from pathlib import Path
 
 # Load environment variables
 load_dotenv()
 
 # Add parent directory to path
-parent_dir = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
 try:
     from utility.logging_config import setup_adk_logging, ensure_debug_logging
     setup_adk_logging(agent_name="auto_memory_agent", file_only=True)
 except ImportError:
-    print("Warning: Could not import logging config")
-
-# Configure retry options
-retry_config = types.HttpRetryOptions(
-    attempts=5,
-    exp_base=7,
-    initial_delay=1,
-    http_status_codes=[429, 500, 503, 504],
-)
+    logging.getLogger(__name__).warning("Could not import logging config")
+
+logger = logging.getLogger(__name__)
+
+# Shared memoized Gemini model: one httpx client, connection pool, and auth
+# handshake across every agent that imports together (falls back to a local
+# instance when utility is absent)
+try:
+    from utility.llm_client import get_shared_gemini
+except ImportError:
+    import functools
+
+    @functools.lru_cache(maxsize=None)
+    def get_shared_gemini(model):
+        return Gemini(
+            model=model,
+            retry_options=types.HttpRetryOptions(
+                attempts=5,
+                exp_base=2,
+                initial_delay=0.5,
+                max_delay=30,
+                http_status_codes=[429, 500, 503, 504],
+            ),
+        )
 
 # Configuration
 APP_NAME = os.getenv("APP_NAME", "AutoMemoryApp")
@@ -47,19 +63,32 @@ MODEL_NAME = os.getenv("AGENT_MODEL", "gemini-2.5-flash-lite")
 session_service = InMemorySessionService()
 memory_service = InMemoryMemoryService()
 
+# Write-through by default; MEMORY_SAVE_INTERVAL=N (N>1) amortizes the
+# memory-service write by ingesting the session only every Nth turn. Each
+# save re-ingests the whole session, so skipped turns are picked up by the
+# next save - the trade-off is that preload_memory can miss the most
+# recent turns in between.
+MEMORY_SAVE_INTERVAL = int(os.getenv("MEMORY_SAVE_INTERVAL", "1"))
+_turn_counts = {}
+
 # Callback for automatic memory storage
 async def auto_save_to_memory(callback_context):
     """
     Automatically save session to memory after each agent turn.
     This callback is triggered after the agent completes processing.
     """
-    await callback_context._invocation_context.memory_service.add_session_to_memory(
-        callback_context._invocation_context.session
-    )
+    # Resolve the invocation context once instead of re-walking the
+    # pydantic attribute chain for each use
+    ctx = callback_context._invocation_context
+    count = _turn_counts.get(ctx.session.id, 0) + 1
+    _turn_counts[ctx.session.id] = count
+    if count % MEMORY_SAVE_INTERVAL:
+        return
+    await ctx.memory_service.add_session_to_memory(ctx.session)
 
 # Create agent with preload_memory (proactive memory loading)
 root_agent = LlmAgent(
-    model=Gemini(model=MODEL_NAME, retry_options=retry_config),
+    model=get_shared_gemini(MODEL_NAME),
     name="AutoMemoryAgent",
     instruction="Answer user questions in simple words. Memory is automatically loaded before each turn.",
     tools=[preload_memory],
@@ -74,10 +103,9 @@ runner = Runner(
     memory_service=memory_service,
 )
 
-print(f"✅ Auto memory agent initialized!")
-print(f"   - App: {APP_NAME}")
-print(f"   - Model: {MODEL_NAME}")
-print(f"   - Automatic memory storage: Enabled (after_agent_callback)")
-print(f"   - Memory retrieval: Proactive (preload_memory)")
+logger.info(
+    "Auto memory agent initialized: app=%s model=%s auto_store=after_agent_callback retrieval=preload_memory",
+    APP_NAME, MODEL_NAME,
+)
 
 
@@ -12,31 +12,47 @@ from google.adk.sessions import DatabaseSessionService, InMemorySessionService
 from google.adk.memory import InMemoryMemoryService
 from google.adk.tools import load_memory, preload_memory
 from google.genai import types
+import logging
 import os
 from dotenv import load_dotenv
 import sys
-from pathlib import Path
 
 # Load environment variables
 load_dotenv()
 
 # Add parent directory to path for utility imports
-parent_dir = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
 try:
     from utility.logging_config import setup_adk_logging, ensure_debug_logging
     setup_adk_logging(agent_name="memory_agent", file_only=True)
 except ImportError:
-    print("Warning: Could not import logging config")
-
-# Configure retry options
-retry_config = types.HttpRetryOptions(
-    attempts=5,
-    exp_base=7,
-    initial_delay=1,
-    http_status_codes=[429, 500, 503, 504],
-)
+    logging.getLogger(__name__).warning("Could not import logging config")
+
+logger = logging.getLogger(__name__)
+
+# Shared memoized Gemini model: one httpx client, connection pool, and auth
+# handshake across every agent that imports together (falls back to a local
+# instance when utility is absent)
+try:
+    from utility.llm_client import get_shared_gemini
+except ImportError:
+    import functools
+
+    @functools.lru_cache(maxsize=None)
+    def get_shared_gemini(model):
+        return Gemini(
+            model=model,
+            retry_options=types.HttpRetryOptions(
+                attempts=5,
+                exp_base=2,
+                initial_delay=0.5,
+                max_delay=30,
+                http_status_codes=[429, 500, 503, 504],
+            ),
+        )
 
 # Configuration
 APP_NAME = os.getenv("APP_NAME", "MemoryDemoApp")
@@ -49,15 +65,15 @@ DB_URL = os.getenv("DB_URL", "sqlite:///memory_data.db")
 
 if SESSION_SERVICE_TYPE == "database":
     session_service = DatabaseSessionService(db_url=DB_URL)
-    print(f"✅ Using DatabaseSessionService: {DB_URL}")
+    logger.info("Using DatabaseSessionService: %s", DB_URL)
 else:
     session_service = InMemorySessionService()
-    print("✅ Using InMemorySessionService (temporary)")
+    logger.info("Using InMemorySessionService (temporary)")
 
 # Memory service (InMemoryMemoryService for development/testing)
 # For production, use VertexAiMemoryBankService (covered in Day 5)
 memory_service = InMemoryMemoryService()
-print("✅ Using InMemoryMemoryService (keyword matching, no persistence)")
+logger.info("Using InMemoryMemoryService (keyword matching, no persistence)")
 
 # Create agent with memory retrieval tool
 # Options: load_memory (reactive) or preload_memory (proactive)
@@ -71,7 +87,7 @@ else:
     memory_description = "Agent decides when to search memory"
 
 root_agent = LlmAgent(
-    model=Gemini(model=MODEL_NAME, retry_options=retry_config),
+    model=get_shared_gemini(MODEL_NAME),
     name="MemoryDemoAgent",
     instruction="Answer user questions in simple words. Use memory tools to recall past conversations when needed.",
     tools=[memory_tool],
@@ -85,11 +101,10 @@ runner = Runner(
     memory_service=memory_service,
 )
 
-print(f"✅ Memory agent initialized!")
-print(f"   - App: {APP_NAME}")
-print(f"   - Model: {MODEL_NAME}")
-print(f"   - Session Service: {session_service.__class__.__name__}")
-print(f"   - Memory Service: {memory_service.__class__.__name__}")
-print(f"   - Memory Mode: {MEMORY_MODE} ({memory_description})")
+logger.info(
+    "Memory agent initialized: app=%s model=%s session_service=%s memory_service=%s memory_mode=%s (%s)",
+    APP_NAME, MODEL_NAME, session_service.__class__.__name__,
+    memory_service.__class__.__name__, MEMORY_MODE, memory_description,
+)
 
 
@@ -4,8 +4,30 @@ Interactive script to run the automatic memory storage agent
 """
 
 import asyncio
+import os
+import sys
+
+# Add project root to path for utility imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
 from agents.auto_memory_agent import runner, USER_ID, APP_NAME
 from google.genai import types
+from utility.streaming import stream_final_text
+
+def _user_content(text: str) -> types.Content:
+    """
+    Wrap user text as a user-role Content.
+
+    model_construct skips pydantic validation - the fields are known-good
+    literals, so each turn costs two plain allocations, not a validation
+    pass.
+    """
+    return types.Content.model_construct(
+        role="user", parts=[types.Part.model_construct(text=text)]
+    )
+
 
 async def run_session(
     runner_instance, user_queries: list[str] | str, session_id: str = "default"
@@ -20,16 +42,13 @@ async def run_session(
     # Process each query
     for query in user_queries:
         print(f"\nUser > {query}")
-        query_content = types.Content(role="user", parts=[types.Part(text=query)])
+        query_content = _user_content(query)
 
         # Stream agent response
-        async for event in runner_instance.run_async(
-            user_id=USER_ID, session_id=session_id, new_message=query_content
+        async for text in stream_final_text(
+            runner_instance, user_id=USER_ID, session_id=session_id, new_message=query_content
         ):
-            if event.is_final_response() and event.content and event.content.parts:
-                text = event.content.parts[0].text
-                if text and text != "None":
-                    print(f"Agent > {text}")
+            print(f"Agent > {text}")
 
 async def main():
     """Run interactive session with the auto memory agent"""
@@ -41,7 +60,11 @@ async def main():
     print("Memory is also automatically loaded before each turn (proactive mode).")
     print()
     
-    session_id = input("Enter session ID (or press Enter for 'default'): ").strip() or "default"
+    # Blocking reads run in a worker thread so the event loop (and any
+    # background memory writes) keeps turning while waiting on the user
+    session_id = (
+        await asyncio.to_thread(input, "Enter session ID (or press Enter for 'default'): ")
+    ).strip() or "default"
     print(f"\nUsing session: {session_id}")
     print("Type 'quit' or 'exit' to end the conversation")
     print()
@@ -50,7 +73,7 @@ async def main():
     print()
     
     while True:
-        user_input = input("You > ").strip()
+        user_input = (await asyncio.to_thread(input, "You > ")).strip()
         
         if user_input.lower() in ['quit', 'exit', 'q']:
             print("\nGoodbye!")
@@ -60,25 +83,40 @@ async def main():
             continue
         
         # Normal conversation (memory is automatically saved and loaded)
-        query = types.Content(role="user", parts=[types.Part(text=user_input)])
+        query = _user_content(user_input)
         
         print(f"\nAgent > ", end="", flush=True)
         
-        # Stream the agent's response
-        async for event in runner.run_async(
+        # Stream the agent's response, merging small chunks in a local
+        # buffer so stdout sees few large writes instead of a flushed
+        # print per chunk (4 KB or a newline forces a flush)
+        buf = bytearray()
+        async for text in stream_final_text(
+            runner,
             user_id=USER_ID,
             session_id=session_id,
             new_message=query
         ):
-            if event.is_final_response() and event.content and event.content.parts:
-                text = event.content.parts[0].text
-                if text and text != "None":
-                    print(text, end="", flush=True)
+            chunk = text.encode()
+            buf += chunk
+            if len(buf) >= 4096 or b"\n" in chunk:
+                sys.stdout.buffer.write(bytes(buf))
+                sys.stdout.flush()
+                buf.clear()
+        if buf:
+            sys.stdout.buffer.write(bytes(buf))
+            sys.stdout.flush()
         
         print("\n")
         print("✅ Conversation automatically saved to memory!")
 
 if __name__ == "__main__":
+    # Use uvloop's C event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
 
 
@@ -4,8 +4,55 @@ Interactive script to run the memory management agent
 """
 
 import asyncio
+import os
+import sys
+from collections import OrderedDict
+
+# Add project root to path for utility imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
 from agents.memory_agent import runner, USER_ID, APP_NAME, session_service, memory_service
 from google.genai import types
+from utility.streaming import stream_final_text
+
+# Repeated searches have strong temporal locality in a chat, so results
+# are kept in a small LRU keyed by the query string - a hit answers
+# instantly with no memory-service round trip
+_QUIT_COMMANDS = frozenset({'quit', 'exit', 'q'})
+
+_SEARCH_CACHE_SIZE = 128
+_search_cache = OrderedDict()
+
+# Strong refs keep in-flight saves alive until their done-callback runs
+_pending_saves = set()
+
+
+def _on_save_done(task):
+    """Report the outcome of a background save-to-memory task."""
+    _pending_saves.discard(task)
+    exc = task.exception()
+    if exc is None:
+        # New memories can change search results, so drop cached ones
+        _search_cache.clear()
+        print("\n✅ Session saved to memory!")
+    else:
+        print(f"\n❌ Error saving to memory: {exc}")
+
+
+def _user_content(text: str) -> types.Content:
+    """
+    Wrap user text as a user-role Content.
+
+    model_construct skips pydantic validation - the fields are known-good
+    literals, so each turn costs two plain allocations, not a validation
+    pass.
+    """
+    return types.Content.model_construct(
+        role="user", parts=[types.Part.model_construct(text=text)]
+    )
+
 
 async def run_session(
     runner_instance, user_queries: list[str] | str, session_id: str = "default"
@@ -13,15 +60,16 @@ async def run_session(
     """Helper function to run queries in a session and display responses."""
     print(f"\n### Session: {session_id}")
 
-    # Create or retrieve session
-    try:
+    # Retrieve the session, creating it only when absent - no exception
+    # raised and unwound on the common path, and nothing swallows
+    # KeyboardInterrupt (get_session returns None for unknown sessions)
+    session = await session_service.get_session(
+        app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+    )
+    if session is None:
         session = await session_service.create_session(
             app_name=APP_NAME, user_id=USER_ID, session_id=session_id
         )
-    except:
-        session = await session_service.get_session(
-            app_name=APP_NAME, user_id=USER_ID, session_id=session_id
-        )
 
     # Convert single query to list
     if isinstance(user_queries, str):
@@ -30,16 +78,13 @@ async def run_session(
     # Process each query
     for query in user_queries:
         print(f"\nUser > {query}")
-        query_content = types.Content(role="user", parts=[types.Part(text=query)])
+        query_content = _user_content(query)
 
         # Stream agent response
-        async for event in runner_instance.run_async(
-            user_id=USER_ID, session_id=session.id, new_message=query_content
+        async for text in stream_final_text(
+            runner_instance, user_id=USER_ID, session_id=session.id, new_message=query_content
         ):
-            if event.is_final_response() and event.content and event.content.parts:
-                text = event.content.parts[0].text
-                if text and text != "None":
-                    print(f"Agent > {text}")
+            print(f"Agent > {text}")
     
     return session
 
@@ -53,7 +98,11 @@ async def main():
     print("Memory persists across different sessions!")
     print()
     
-    session_id = input("Enter session ID (or press Enter for 'default'): ").strip() or "default"
+    # Blocking reads run in a worker thread so the event loop (and any
+    # background memory writes) keeps turning while waiting on the user
+    session_id = (
+        await asyncio.to_thread(input, "Enter session ID (or press Enter for 'default'): ")
+    ).strip() or "default"
     print(f"\nUsing session: {session_id}")
     print("Type 'quit' or 'exit' to end the conversation")
     print("Type 'save' to save current session to memory")
@@ -61,9 +110,12 @@ async def main():
     print()
     
     while True:
-        user_input = input("You > ").strip()
+        user_input = (await asyncio.to_thread(input, "You > ")).strip()
+        
+        # Lowercase once per turn; the command checks reuse it
+        cmd = user_input.lower()
         
-        if user_input.lower() in ['quit', 'exit', 'q']:
+        if cmd in _QUIT_COMMANDS:
             print("\nGoodbye!")
             break
         
@@ -71,23 +123,35 @@ async def main():
             continue
         
         # Handle special commands
-        if user_input.lower() == 'save':
+        if cmd == 'save':
             try:
                 session = await session_service.get_session(
                     app_name=APP_NAME, user_id=USER_ID, session_id=session_id
                 )
-                await memory_service.add_session_to_memory(session)
-                print("✅ Session saved to memory!")
             except Exception as e:
                 print(f"❌ Error saving to memory: {e}")
+                continue
+            # Fire and forget: the ingest overlaps the user's think time
+            # instead of blocking the prompt, and the done-callback reports
+            # success or failure when it lands
+            task = asyncio.create_task(memory_service.add_session_to_memory(session))
+            _pending_saves.add(task)
+            task.add_done_callback(_on_save_done)
             continue
         
-        if user_input.lower().startswith('search '):
+        if cmd.startswith('search '):
             query = user_input[7:].strip()
             try:
-                search_response = await memory_service.search_memory(
-                    app_name=APP_NAME, user_id=USER_ID, query=query
-                )
+                search_response = _search_cache.get(query)
+                if search_response is not None:
+                    _search_cache.move_to_end(query)
+                else:
+                    search_response = await memory_service.search_memory(
+                        app_name=APP_NAME, user_id=USER_ID, query=query
+                    )
+                    _search_cache[query] = search_response
+                    if len(_search_cache) > _SEARCH_CACHE_SIZE:
+                        _search_cache.popitem(last=False)
                 print(f"\n🔍 Search Results: Found {len(search_response.memories)} memories")
                 for memory in search_response.memories[:5]:  # Show first 5
                     if memory.content and memory.content.parts:
@@ -98,24 +162,39 @@ async def main():
             continue
         
         # Normal conversation
-        query = types.Content(role="user", parts=[types.Part(text=user_input)])
+        query = _user_content(user_input)
         
         print(f"\nAgent > ", end="", flush=True)
         
-        # Stream the agent's response
-        async for event in runner.run_async(
+        # Stream the agent's response, merging small chunks in a local
+        # buffer so stdout sees few large writes instead of a flushed
+        # print per chunk (4 KB or a newline forces a flush)
+        buf = bytearray()
+        async for text in stream_final_text(
+            runner,
             user_id=USER_ID,
             session_id=session_id,
             new_message=query
         ):
-            if event.is_final_response() and event.content and event.content.parts:
-                text = event.content.parts[0].text
-                if text and text != "None":
-                    print(text, end="", flush=True)
+            chunk = text.encode()
+            buf += chunk
+            if len(buf) >= 4096 or b"\n" in chunk:
+                sys.stdout.buffer.write(bytes(buf))
+                sys.stdout.flush()
+                buf.clear()
+        if buf:
+            sys.stdout.buffer.write(bytes(buf))
+            sys.stdout.flush()
         
         print("\n")
 
 if __name__ == "__main__":
+    # Use uvloop's C event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
 
 
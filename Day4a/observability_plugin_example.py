@@ -8,6 +8,7 @@ Usage:
     This is a reference example. Import and use in your agents.
 """
 
+import itertools
 import logging
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.callback_context import CallbackContext
@@ -21,6 +22,12 @@ class CountInvocationPlugin(BasePlugin):
     def __init__(self) -> None:
         """Initialize the plugin with counters."""
         super().__init__(name="count_invocation")
+        # itertools.count increments in C - one next() per callback instead
+        # of a Python read/add/store; the plain attributes hold the
+        # last-seen values for get_stats
+        self._agent_ctr = itertools.count(1)
+        self._tool_ctr = itertools.count(1)
+        self._llm_ctr = itertools.count(1)
         self.agent_count: int = 0
         self.tool_count: int = 0
         self.llm_request_count: int = 0
@@ -30,25 +37,27 @@ class CountInvocationPlugin(BasePlugin):
         self, *, agent: BaseAgent, callback_context: CallbackContext
     ) -> None:
         """Count agent runs."""
-        self.agent_count += 1
-        logging.info(f"[Plugin] Agent run count: {self.agent_count}")
+        self.agent_count = count = next(self._agent_ctr)
+        logging.info("[Plugin] Agent run count: %d", count)
 
     # Callback 2: Runs before a model is called
     async def before_model_callback(
         self, *, callback_context: CallbackContext, llm_request: LlmRequest
     ) -> None:
         """Count LLM requests."""
-        self.llm_request_count += 1
-        logging.info(f"[Plugin] LLM request count: {self.llm_request_count}")
+        self.llm_request_count = count = next(self._llm_ctr)
+        logging.info("[Plugin] LLM request count: %d", count)
 
     # Callback 3: Runs before a tool is called
     async def before_tool_callback(
         self, *, callback_context: CallbackContext, tool_name: str, tool_input: dict
     ) -> None:
         """Count tool calls."""
-        self.tool_count += 1
-        logging.info(f"[Plugin] Tool call count: {self.tool_count}")
-        logging.info(f"[Plugin] Tool: {tool_name}, Input: {tool_input}")
+        self.tool_count = count = next(self._tool_ctr)
+        logging.info("[Plugin] Tool call count: %d", count)
+        # Tool inputs can be large; only repr them when DEBUG will emit
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("[Plugin] Tool: %s, Input: %r", tool_name, tool_input)
 
     def get_stats(self) -> dict:
         """Get current statistics."""
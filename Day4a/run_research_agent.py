@@ -10,16 +10,17 @@ Usage:
 """
 
 import asyncio
+import os
 import sys
-from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 # Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.dirname(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from google.adk.runners import InMemoryRunner
 from google.adk.plugins.logging_plugin import LoggingPlugin
@@ -4,12 +4,17 @@ from google.adk.models.google_llm import Gemini
 from google.genai import types
 
 # Configure Model Retry on errors
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,
-    http_status_codes=[429, 500, 503, 504],  # Retry on these HTTP errors
-)
+# Shared retry policy (falls back to a local literal when utility is absent)
+try:
+    from utility.retry_config import RETRY_CONFIG as retry_config
+except ImportError:
+    retry_config = types.HttpRetryOptions(
+        attempts=5,
+        exp_base=2,
+        initial_delay=0.5,
+        max_delay=30,
+        http_status_codes=[429, 500, 503, 504],
+    )
 
 def set_device_status(location: str, device_id: str, status: str) -> dict:
     """Sets the status of a smart home device.
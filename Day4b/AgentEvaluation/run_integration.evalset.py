@@ -1,36 +1,52 @@
+import json
+import sys
+
+# Compact separators by default: indent=2 buffers the whole pretty-printed
+# evalset as one string before it hits disk. Pass --pretty when a
+# human-readable file is worth that cost.
 with open("home_automation_agent/integration.evalset.json", "w") as f:
-    json.dump(test_cases, f, indent=2)
+    if "--pretty" in sys.argv:
+        json.dump(test_cases, f, indent=2)
+    else:
+        json.dump(test_cases, f, separators=(",", ":"))
 
 print("✅ Evaluation test cases created")
-print("\n🧪 Test scenarios:")
-for case in test_cases["eval_cases"]:
-    user_msg = case["conversation"][0]["user_content"]["parts"][0]["text"]
-    print(f"• {case['eval_id']}: {user_msg}")
 
-print("\n📊 Expected results:")
-print("• basic_device_control: Should pass both criteria")
-print(
-    "• wrong_tool_usage_test: May fail tool_trajectory if agent uses wrong parameters"
-)
-print(
-    "• poor_response_quality_test: May fail response_match if response differs too much"
-)
+# One pass over the cases, one write for the whole block: the deep
+# indexing chain runs once per case and stdout sees a single syscall
+# instead of one per scenario
+scenario_lines = [
+    f"• {case['eval_id']}: {case['conversation'][0]['user_content']['parts'][0]['text']}"
+    for case in test_cases["eval_cases"]
+]
+sys.stdout.write("\n🧪 Test scenarios:\n" + "\n".join(scenario_lines) + "\n")
+
+sys.stdout.write("\n".join([
+    "",
+    "📊 Expected results:",
+    "• basic_device_control: Should pass both criteria",
+    "• wrong_tool_usage_test: May fail tool_trajectory if agent uses wrong parameters",
+    "• poor_response_quality_test: May fail response_match if response differs too much",
+]) + "\n")
+
 # Analyzing evaluation results - the data science approach
-print("📊 Understanding Evaluation Results:")
-print()
-print("🔍 EXAMPLE ANALYSIS:")
-print()
-print("Test Case: living_room_light_on")
-print("  ❌ response_match_score: 0.45/0.80")
-print("  ✅ tool_trajectory_avg_score: 1.0/1.0")
-print()
-print("📈 What this tells us:")
-print("• TOOL USAGE: Perfect - Agent used correct tool with correct parameters")
-print("• RESPONSE QUALITY: Poor - Response text too different from expected")
-print("• ROOT CAUSE: Agent's communication style, not functionality")
-print()
-print("🎯 ACTIONABLE INSIGHTS:")
-print("1. Technical capability works (tool usage perfect)")
-print("2. Communication needs improvement (response quality failed)")
-print("3. Fix: Update agent instructions for clearer language or constrained response.")
-print()
\ No newline at end of file
+sys.stdout.write("\n".join([
+    "📊 Understanding Evaluation Results:",
+    "",
+    "🔍 EXAMPLE ANALYSIS:",
+    "",
+    "Test Case: living_room_light_on",
+    "  ❌ response_match_score: 0.45/0.80",
+    "  ✅ tool_trajectory_avg_score: 1.0/1.0",
+    "",
+    "📈 What this tells us:",
+    "• TOOL USAGE: Perfect - Agent used correct tool with correct parameters",
+    "• RESPONSE QUALITY: Poor - Response text too different from expected",
+    "• ROOT CAUSE: Agent's communication style, not functionality",
+    "",
+    "🎯 ACTIONABLE INSIGHTS:",
+    "1. Technical capability works (tool usage perfect)",
+    "2. Communication needs improvement (response quality failed)",
+    "3. Fix: Update agent instructions for clearer language or constrained response.",
+    "",
+]) + "\n")
\ No newline at end of file
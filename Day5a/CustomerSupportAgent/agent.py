@@ -33,13 +33,17 @@ try:
 except ImportError:
     print("Warning: Could not import logging config")
 
-# Configure retry options
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,
-    http_status_codes=[429, 500, 503, 504],  # Retry on these HTTP errors
-)
+# Shared retry policy (falls back to a local literal when utility is absent)
+try:
+    from utility.retry_config import RETRY_CONFIG as retry_config
+except ImportError:
+    retry_config = types.HttpRetryOptions(
+        attempts=5,
+        exp_base=2,
+        initial_delay=0.5,
+        max_delay=30,
+        http_status_codes=[429, 500, 503, 504],
+    )
 
 # Get Product Catalog Agent URL from environment or use default
 PRODUCT_CATALOG_URL = os.getenv("PRODUCT_CATALOG_URL", "http://localhost:8001")
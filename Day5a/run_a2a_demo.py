@@ -14,9 +14,10 @@ Usage:
 """
 
 import asyncio
+import io
 import uuid
+import os
 import sys
-from pathlib import Path
 from dotenv import load_dotenv
 
 from google.genai import types
@@ -27,11 +28,53 @@ from google.adk.sessions import InMemorySessionService
 load_dotenv()
 
 # Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.dirname(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 # Import the customer support agent
 from Day5a.CustomerSupportAgent.agent import customer_support_agent
+from utility.streaming import stream_final_text
+
+# Serializes the per-test output blocks when the tests run concurrently
+_print_lock = asyncio.Lock()
+
+# One session service and runner for the whole demo: agent bootstrap and
+# service allocation happen once, each test only gets a fresh session id
+_APP_NAME = "support_app"
+_USER_ID = "demo_user"
+_session_service = InMemorySessionService()
+_runner = Runner(
+    agent=customer_support_agent, app_name=_APP_NAME, session_service=_session_service
+)
+
+
+async def _run_pool(coros, k=4):
+    """
+    Run coroutines with at most k in flight.
+
+    gather launches everything at once; as the demo grows past a handful
+    of queries that would open N concurrent sessions against the catalog
+    server. This keeps a pending set topped up to k, so a slow query
+    doesn't head-of-line block the rest and the server sees bounded load.
+
+    Args:
+        coros: Iterable of coroutines to run.
+        k: Maximum number of coroutines in flight at once.
+    """
+    pending = set()
+    it = iter(coros)
+    while True:
+        while len(pending) < k:
+            try:
+                pending.add(asyncio.ensure_future(next(it)))
+            except StopIteration:
+                break
+        if not pending:
+            return
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.result()  # surface failures
 
 
 async def test_a2a_communication(user_query: str):
@@ -47,45 +90,36 @@ async def test_a2a_communication(user_query: str):
     Args:
         user_query: The question to ask the Customer Support Agent
     """
-    # Setup session management (required by ADK)
-    session_service = InMemorySessionService()
-
-    # Session identifiers
-    app_name = "support_app"
-    user_id = "demo_user"
     # Use unique session ID for each test to avoid conflicts
     session_id = f"demo_session_{uuid.uuid4().hex[:8]}"
 
-    # CRITICAL: Create session BEFORE running agent (synchronous, not async!)
-    session = await session_service.create_session(
-        app_name=app_name, user_id=user_id, session_id=session_id
-    )
-
-    # Create runner for the Customer Support Agent
-    # The runner manages the agent execution and session state
-    runner = Runner(
-        agent=customer_support_agent, app_name=app_name, session_service=session_service
+    # CRITICAL: Create session BEFORE running agent (the shared service and
+    # runner are module-level; only the session is per-test)
+    session = await _session_service.create_session(
+        app_name=_APP_NAME, user_id=_USER_ID, session_id=session_id
     )
 
     # Create the user message
     test_content = types.Content(parts=[types.Part(text=user_query)])
 
-    # Display query
-    print(f"\n👤 Customer: {user_query}")
-    print(f"\n🎧 Support Agent response:")
-    print("-" * 60)
+    # Build the whole block off-screen so concurrent tests don't interleave
+    out = io.StringIO()
+    out.write(f"\n👤 Customer: {user_query}\n")
+    out.write("\n🎧 Support Agent response:\n")
+    out.write("-" * 60 + "\n")
 
-    # Run the agent asynchronously (handles streaming responses and A2A communication)
-    async for event in runner.run_async(
-        user_id=user_id, session_id=session_id, new_message=test_content
+    # Run the agent asynchronously (handles streaming responses and A2A
+    # communication); the shared helper filters out intermediate events
+    async for text in stream_final_text(
+        _runner, user_id=_USER_ID, session_id=session_id, new_message=test_content
     ):
-        # Print final response only (skip intermediate events)
-        if event.is_final_response() and event.content:
-            for part in event.content.parts:
-                if hasattr(part, "text"):
-                    print(part.text)
+        out.write(f"{text}\n")
+
+    out.write("-" * 60)
 
-    print("-" * 60)
+    # Print atomically: one holder of the lock writes at a time
+    async with _print_lock:
+        print(out.getvalue())
 
 
 async def main():
@@ -97,25 +131,27 @@ async def main():
     print("   Run: python run_product_catalog_server.py")
     print("=" * 60)
     
-    # Test 1: Single product inquiry
-    print("\n📦 Test 1: Single Product Inquiry")
-    await test_a2a_communication("Can you tell me about the iPhone 15 Pro? Is it in stock?")
-    
-    # Test 2: Compare multiple products
-    print("\n📦 Test 2: Compare Multiple Products")
-    await test_a2a_communication(
-        "I'm looking for a laptop. Can you compare the Dell XPS 15 and MacBook Pro 14 for me?"
-    )
-    
-    # Test 3: Specific product inquiry
-    print("\n📦 Test 3: Specific Product Inquiry")
-    await test_a2a_communication(
-        "Do you have the Sony WH-1000XM5 headphones? What's the price?"
-    )
+    # The tests use independent sessions against the same remote server,
+    # so run them concurrently through the bounded pool: network round
+    # trips overlap, but adding more queries below never opens more than
+    # k sessions at once
+    print("\n📦 Tests: single inquiry / comparison / specific inquiry")
+    queries = [
+        "Can you tell me about the iPhone 15 Pro? Is it in stock?",
+        "I'm looking for a laptop. Can you compare the Dell XPS 15 and MacBook Pro 14 for me?",
+        "Do you have the Sony WH-1000XM5 headphones? What's the price?",
+    ]
+    await _run_pool((test_a2a_communication(q) for q in queries), k=4)
     
     print("\n✅ All tests completed!")
 
 
 if __name__ == "__main__":
+    # Use uvloop's C event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
 
@@ -14,23 +14,38 @@ You can change the port by setting PRODUCT_CATALOG_PORT environment variable.
 import os
 import sys
 import uvicorn
-from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 # Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.dirname(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 # Import the agent app
 from Day5a.ProductCatalogAgent.agent import app
 
+# Prefer the C-backed event loop and HTTP parser when installed; both are
+# drop-in and cut per-request overhead, and the stock implementations
+# remain the fallback
+try:
+    import uvloop  # noqa: F401
+    LOOP_IMPL = "uvloop"
+except ImportError:
+    LOOP_IMPL = "asyncio"
+try:
+    import httptools  # noqa: F401
+    HTTP_IMPL = "httptools"
+except ImportError:
+    HTTP_IMPL = "h11"
+
 if __name__ == "__main__":
     # Get port from environment or use default
     port = int(os.getenv("PRODUCT_CATALOG_PORT", "8001"))
     host = os.getenv("PRODUCT_CATALOG_HOST", "localhost")
+    workers = int(os.getenv("PRODUCT_CATALOG_WORKERS", "1"))
     
     print("=" * 60)
     print("Product Catalog Agent - A2A Server")
@@ -40,11 +55,18 @@ if __name__ == "__main__":
     print("Press Ctrl+C to stop the server")
     print("=" * 60)
     
-    # Run the server
+    # Run the server. Access logging formats and writes a line per
+    # request, so it stays off; PRODUCT_CATALOG_WORKERS>1 scales past the
+    # single event loop, and uvicorn then needs the app as an import
+    # string so each worker process can re-import it.
     uvicorn.run(
-        app,
+        app if workers == 1 else "Day5a.ProductCatalogAgent.agent:app",
         host=host,
         port=port,
-        log_level="info"
+        access_log=False,
+        log_level="warning",
+        loop=LOOP_IMPL,
+        http=HTTP_IMPL,
+        workers=workers
     )
 
@@ -10,18 +10,17 @@ This agent provides weather information for cities and demonstrates:
 
 import os
 import sys
-from pathlib import Path
 from dotenv import load_dotenv
 
-import vertexai
 from google.adk.agents import Agent
 
 # Load environment variables
 load_dotenv()
 
 # Add project root to path for utility imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 try:
     from utility.logging_config import setup_adk_logging, ensure_debug_logging
@@ -35,12 +34,45 @@ project_id = os.environ.get("GOOGLE_CLOUD_PROJECT")
 location = os.environ.get("GOOGLE_CLOUD_LOCATION", "global")
 
 if project_id:
+    # Imported lazily: paths that never initialize Vertex (no project id,
+    # e.g. local discovery) skip the SDK's import cost entirely
+    import vertexai
+
     vertexai.init(project=project_id, location=location)
     print(f"✅ Vertex AI initialized: project={project_id}, location={location}")
 else:
     print("⚠️  GOOGLE_CLOUD_PROJECT not set. Vertex AI initialization skipped.")
 
 
+# Mock weather database with structured responses, built once at import
+# instead of per call
+_WEATHER_DATA = {
+    "san francisco": {
+        "status": "success",
+        "report": "The weather in San Francisco is sunny with a temperature of 72°F (22°C).",
+    },
+    "new york": {
+        "status": "success",
+        "report": "The weather in New York is cloudy with a temperature of 65°F (18°C).",
+    },
+    "london": {
+        "status": "success",
+        "report": "The weather in London is rainy with a temperature of 58°F (14°C).",
+    },
+    "tokyo": {
+        "status": "success",
+        "report": "The weather in Tokyo is clear with a temperature of 70°F (21°C).",
+    },
+    "paris": {
+        "status": "success",
+        "report": "The weather in Paris is partly cloudy with a temperature of 68°F (20°C).",
+    },
+}
+
+# Precomputed once; the miss path used to rebuild this string per call
+_AVAILABLE_CITIES = ", ".join(c.title() for c in _WEATHER_DATA)
+
+
 def get_weather(city: str) -> dict:
     """
     Returns weather information for a given city.
@@ -55,40 +87,15 @@ def get_weather(city: str) -> dict:
     Returns:
         dict: Dictionary with status and weather report or error message
     """
-    # Mock weather database with structured responses
-    weather_data = {
-        "san francisco": {
-            "status": "success",
-            "report": "The weather in San Francisco is sunny with a temperature of 72°F (22°C).",
-        },
-        "new york": {
-            "status": "success",
-            "report": "The weather in New York is cloudy with a temperature of 65°F (18°C).",
-        },
-        "london": {
-            "status": "success",
-            "report": "The weather in London is rainy with a temperature of 58°F (14°C).",
-        },
-        "tokyo": {
-            "status": "success",
-            "report": "The weather in Tokyo is clear with a temperature of 70°F (21°C).",
-        },
-        "paris": {
-            "status": "success",
-            "report": "The weather in Paris is partly cloudy with a temperature of 68°F (20°C).",
-        },
+    # Single .get() instead of an `in` check followed by indexing
+    entry = _WEATHER_DATA.get(city.lower())
+    if entry is not None:
+        return entry
+    return {
+        "status": "error",
+        "error_message": f"Weather information for '{city}' is not available. Try: {_AVAILABLE_CITIES}",
     }
 
-    city_lower = city.lower()
-    if city_lower in weather_data:
-        return weather_data[city_lower]
-    else:
-        available_cities = ", ".join([c.title() for c in weather_data.keys()])
-        return {
-            "status": "error",
-            "error_message": f"Weather information for '{city}' is not available. Try: {available_cities}",
-        }
-
 
 # Create the root agent
 # This is the agent that will be deployed to Agent Engine
@@ -7,21 +7,20 @@ Usage:
     python cleanup_agent.py --project-id YOUR_PROJECT_ID --region us-east4
 """
 
+import concurrent.futures
 import os
 import sys
 import argparse
-from pathlib import Path
 from dotenv import load_dotenv
 
-import vertexai
-from vertexai import agent_engines
 
 # Load environment variables
 load_dotenv()
 
 # Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.dirname(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 
 def cleanup_agents(project_id: str, region: str, force: bool = True):
@@ -34,6 +33,10 @@ def cleanup_agents(project_id: str, region: str, force: bool = True):
         force: Force deletion even if agent is running
     """
     # Initialize Vertex AI
+    # Lazy SDK import keeps --help and argument errors fast
+    import vertexai
+    from vertexai import agent_engines
+
     vertexai.init(project=project_id, location=region)
 
     print("=" * 60)
@@ -54,15 +57,27 @@ def cleanup_agents(project_id: str, region: str, force: bool = True):
     for i, agent in enumerate(agents_list, 1):
         print(f"  {i}. {agent.resource_name}")
 
-    # Delete each agent
-    print(f"\nDeleting {len(agents_list)} agent(s)...")
-    for agent in agents_list:
+    # Delete concurrently: each delete is an independent RPC, so a small
+    # thread pool makes the phase cost roughly the slowest delete instead
+    # of the sum
+    def _delete_one(agent):
         try:
-            print(f"\nDeleting: {agent.resource_name}")
             agent_engines.delete(resource_name=agent.resource_name, force=force)
-            print(f"✅ Successfully deleted: {agent.resource_name}")
+            return agent.resource_name, None
         except Exception as e:
-            print(f"❌ Failed to delete {agent.resource_name}: {e}")
+            return agent.resource_name, e
+
+    print(f"\nDeleting {len(agents_list)} agent(s)...")
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(16, len(agents_list))
+    ) as executor:
+        results = list(executor.map(_delete_one, agents_list))
+
+    for name, error in results:
+        if error is None:
+            print(f"✅ Successfully deleted: {name}")
+        else:
+            print(f"❌ Failed to delete {name}: {error}")
 
     print("\n✅ Cleanup completed!")
     print("\nNote: Deletion typically takes 1-2 minutes.")
@@ -24,11 +24,12 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.dirname(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 
-def deploy_agent(project_id: str, region: str, agent_dir: str = None):
+def deploy_agent(project_id: str, region: str, agent_dir: str = None, exec_process: bool = False):
     """
     Deploy agent to Vertex AI Agent Engine.
 
@@ -36,6 +37,10 @@ def deploy_agent(project_id: str, region: str, agent_dir: str = None):
         project_id: Google Cloud project ID
         region: Deployment region (e.g., us-east4, europe-west1)
         agent_dir: Directory containing agent files (default: WeatherAssistant)
+        exec_process: If True, replace this process with the adk CLI
+            instead of forking a child - the interpreter's pages are freed
+            for the duration of the deploy. Only valid when nothing needs
+            to run after the command.
     """
     if agent_dir is None:
         agent_dir = Path(__file__).parent / "WeatherAssistant"
@@ -73,9 +78,21 @@ def deploy_agent(project_id: str, region: str, agent_dir: str = None):
 
     print(f"\nRunning: {' '.join(cmd)}\n")
 
-    # Run the deployment command
+    if exec_process:
+        # execvp does not return on success; adk takes over this process
+        try:
+            os.execvp(cmd[0], cmd)
+        except FileNotFoundError:
+            print("\n❌ ADK CLI not found. Please install it:")
+            print("   pip install google-adk")
+            return False
+
+    # Run the deployment command. stdin is closed off so the child can
+    # never sit waiting on an inherited terminal in CI.
     try:
-        result = subprocess.run(cmd, check=True, capture_output=False, text=True)
+        result = subprocess.run(
+            cmd, check=True, capture_output=False, text=True, stdin=subprocess.DEVNULL
+        )
         print("\n✅ Deployment completed successfully!")
         print("\nNext steps:")
         print("1. Wait 2-5 minutes for the agent to be ready")
@@ -121,7 +138,8 @@ def main():
         print("❌ Error: --project-id is required or set GOOGLE_CLOUD_PROJECT env var")
         sys.exit(1)
 
-    success = deploy_agent(args.project_id, args.region, args.agent_dir)
+    # As the final action of the script, let adk replace this process
+    success = deploy_agent(args.project_id, args.region, args.agent_dir, exec_process=True)
     sys.exit(0 if success else 1)
 
 
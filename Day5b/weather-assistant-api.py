@@ -7,10 +7,15 @@ This allows the agent to be deployed to Docker Desktop and Cloud Run.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
+import inspect
+import functools
 import sys
 import os
+import time
+import uuid
 from pathlib import Path
 import asyncio
 from dotenv import load_dotenv
@@ -23,10 +28,33 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(Path(__file__).parent))
 
+
+# Prefer the C-backed event loop and HTTP parser when installed (they ship
+# with uvicorn[standard]); the stock asyncio/h11 implementations remain the
+# fallback
+try:
+    import uvloop  # noqa: F401
+    LOOP_IMPL = "uvloop"
+except ImportError:
+    LOOP_IMPL = "asyncio"
+try:
+    import httptools  # noqa: F401
+    HTTP_IMPL = "httptools"
+except ImportError:
+    HTTP_IMPL = "h11"
+# orjson serializes responses in C; fall back to the stdlib-backed
+# JSONResponse when it isn't installed
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _ResponseClass
+except ImportError:
+    from fastapi.responses import JSONResponse as _ResponseClass
+
 app = FastAPI(
     title="Weather Assistant API",
     description="REST API for WeatherAssistant ADK agent",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=_ResponseClass
 )
 
 # Enable CORS
@@ -77,6 +105,29 @@ def get_runner():
             raise Exception(f"Failed to create runner: {str(e)}")
     return runner_cache
 
+# Serializes the cold load so two simultaneous first requests don't both
+# exec the agent module and discard one of the runners
+_runner_lock = asyncio.Lock()
+
+async def get_runner_async():
+    """Get or create the runner without blocking the event loop."""
+    if runner_cache is not None:
+        return runner_cache
+    async with _runner_lock:
+        if runner_cache is None:
+            # The cold load execs the agent module - blocking work, so it
+            # runs in a thread while the lock holds competing requests
+            await asyncio.to_thread(get_runner)
+    return runner_cache
+
+@app.on_event("startup")
+async def warm_runner():
+    """Build the agent and runner before the first request arrives."""
+    try:
+        await get_runner_async()
+    except Exception as e:
+        print(f"⚠️  Failed to preload agent: {e}")
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -103,6 +154,14 @@ async def health():
             "error": str(e)
         }
 
+def _extract_text(response):
+    """Pull the final text out of a non-streaming runner response."""
+    if hasattr(response, 'messages') and response.messages:
+        return response.messages[-1].content if hasattr(response.messages[-1], 'content') else str(response.messages[-1])
+    if hasattr(response, 'content'):
+        return response.content
+    return str(response)
+
 @app.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """
@@ -112,37 +171,138 @@ async def chat(request: ChatRequest):
     """
     try:
         # Get runner
-        runner = get_runner()
-        
-        # Run the agent
-        response = await runner.run(request.message)
+        runner = await get_runner_async()
         
-        # Extract text response
-        if hasattr(response, 'messages') and response.messages:
-            response_text = response.messages[-1].content if hasattr(response.messages[-1], 'content') else str(response.messages[-1])
-        elif hasattr(response, 'content'):
-            response_text = response.content
+        # Prefer the async event pipeline: run_async lets ADK overlap a
+        # sub-agent's tool I/O (e.g. the A2A catalog HTTP call) with
+        # continued model generation, where a single blocking run call
+        # serializes the two. The joined stream is the full response.
+        if hasattr(runner, "run_async"):
+            response_text = "".join(
+                [chunk async for chunk in _stream_chunks(
+                    runner, request.message, request.conversation_id
+                )]
+            )
+        # Fallback for runners without run_async. If runner.run is
+        # synchronous under the hood, awaiting it on the loop would
+        # starve every other in-flight request while it does
+        # tokenizer/tool work - push it to a worker thread.
+        elif inspect.iscoroutinefunction(type(runner).run):
+            response = await runner.run(request.message)
+            response_text = _extract_text(response)
         else:
-            response_text = str(response)
+            response = await asyncio.to_thread(runner.run, request.message)
+            response_text = _extract_text(response)
         
-        return ChatResponse(
+        # model_construct skips pydantic validation: the fields are
+        # internally built and already the right types
+        return ChatResponse.model_construct(
             response=response_text,
             conversation_id=request.conversation_id
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error running agent: {str(e)}")
 
+def _sse_event(chunk: str) -> str:
+    """
+    Frame one text chunk as a Server-Sent Events data event.
+
+    SSE parses each line separately: text after an embedded newline
+    would be read as an unknown field and silently dropped by compliant
+    clients, so every line of the chunk gets its own data: prefix.
+    """
+    return "".join(f"data: {line}\n" for line in chunk.split("\n")) + "\n"
+
+async def _stream_chunks(runner, message: str, conversation_id: Optional[str]):
+    """
+    Yield the agent's response text in ~50ms windows as it is generated.
+
+    Yielding every raw model chunk pays per-chunk HTTP framing and write
+    overhead; batching into short windows keeps time-to-first-token low
+    while cutting the chunk count by an order of magnitude.
+    """
+    from google.genai import types
+
+    user_id = "api_user"
+    session_id = conversation_id or f"stream_{uuid.uuid4().hex[:8]}"
+    session = await runner.session_service.get_session(
+        app_name=runner.app_name, user_id=user_id, session_id=session_id
+    )
+    if session is None:
+        await runner.session_service.create_session(
+            app_name=runner.app_name, user_id=user_id, session_id=session_id
+        )
+
+    content = types.Content(role="user", parts=[types.Part(text=message)])
+    buf = []
+    last_flush = time.monotonic()
+    async for event in runner.run_async(
+        user_id=user_id, session_id=session_id, new_message=content
+    ):
+        if event.content and event.content.parts:
+            text = "".join(p.text for p in event.content.parts if p.text)
+            if text:
+                buf.append(text)
+        if buf and time.monotonic() - last_flush > 0.05:
+            yield "".join(buf)
+            buf.clear()
+            last_flush = time.monotonic()
+    if buf:
+        yield "".join(buf)
+
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Stream a chat response as the agent generates it.
+
+    /chat buffers the full response, so time-to-first-byte equals total
+    generation time. This endpoint starts emitting text as soon as the
+    first window fills; /chat stays as-is for non-streaming clients.
+    """
+    try:
+        runner = await get_runner_async()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error running agent: {str(e)}")
+    async def _sse():
+        async for chunk in _stream_chunks(
+            runner, request.message, request.conversation_id
+        ):
+            yield _sse_event(chunk)
+
+    return StreamingResponse(_sse(), media_type="text/event-stream")
+
+# Tool names are static for the process lifetime; compute the tuple once
+# per agent instead of reflecting over agent.tools on every rebuild
+_tool_names_cache = {}
+
+def _tool_names(agent):
+    """Return the agent's tool names, computed once per agent instance."""
+    names = _tool_names_cache.get(id(agent))
+    if names is None:
+        names = tuple(
+            getattr(tool, 'name', None) or repr(tool)
+            for tool in getattr(agent, 'tools', ())
+        )
+        _tool_names_cache[id(agent)] = names
+    return names
+
+@functools.lru_cache(maxsize=4)
+def _build_info(bucket: int):
+    """Build the info payload; the time bucket expires entries every 60s."""
+    agent = get_agent()
+    return {
+        "name": getattr(agent, 'name', 'weather_assistant'),
+        "description": getattr(agent, 'description', 'Weather assistant agent'),
+        "model": getattr(agent, 'model', 'Unknown'),
+        "tools": list(_tool_names(agent))
+    }
+
 @app.get("/info")
 async def info():
     """Get information about the agent."""
     try:
-        agent = get_agent()
-        return {
-            "name": getattr(agent, 'name', 'weather_assistant'),
-            "description": getattr(agent, 'description', 'Weather assistant agent'),
-            "model": getattr(agent, 'model', 'Unknown'),
-            "tools": [tool.name if hasattr(tool, 'name') else str(tool) for tool in getattr(agent, 'tools', [])]
-        }
+        # Metadata is static at runtime; serve the memoized payload
+        return _build_info(int(time.monotonic() // 60))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting agent info: {str(e)}")
 
@@ -151,6 +311,7 @@ if __name__ == "__main__":
     
     # Cloud Run sets PORT environment variable
     port = int(os.getenv("PORT", "8080"))
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
     host = os.getenv("API_HOST", "0.0.0.0")
     
     print(f"""
@@ -170,5 +331,16 @@ if __name__ == "__main__":
     - GET /info for agent information
     """)
     
-    uvicorn.run(app, host=host, port=port)
+    # WEB_CONCURRENCY>1 runs parallel worker interpreters so concurrent
+    # requests stop serializing on one GIL. Workers need the app as an
+    # import string to re-import it per process; the agent/runner caches
+    # are module globals, so each worker fills its own lazily.
+    uvicorn.run(
+        app if workers == 1 else "weather-assistant-api:app",
+        host=host,
+        port=port,
+        loop=LOOP_IMPL,
+        http=HTTP_IMPL,
+        workers=workers
+    )
 
@@ -11,10 +11,15 @@ Run: python agents-api-server.py
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
+import inspect
+import functools
 import sys
 import os
+import time
+import uuid
 import importlib.util
 from pathlib import Path
 import asyncio
@@ -25,12 +30,36 @@ load_dotenv()
 
 # Add project root to path
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+
+# Prefer the C-backed event loop and HTTP parser when installed (they ship
+# with uvicorn[standard]); the stock asyncio/h11 implementations remain the
+# fallback
+try:
+    import uvloop  # noqa: F401
+    LOOP_IMPL = "uvloop"
+except ImportError:
+    LOOP_IMPL = "asyncio"
+try:
+    import httptools  # noqa: F401
+    HTTP_IMPL = "httptools"
+except ImportError:
+    HTTP_IMPL = "h11"
+# orjson serializes responses in C; fall back to the stdlib-backed
+# JSONResponse when it isn't installed
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _ResponseClass
+except ImportError:
+    from fastapi.responses import JSONResponse as _ResponseClass
 
 app = FastAPI(
     title="ADK Agents API",
     description="REST API for Google ADK agents - compatible with ChatGPT",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=_ResponseClass
 )
 
 # Enable CORS for ChatGPT and other clients
@@ -57,37 +86,90 @@ class ChatResponse(BaseModel):
 agents_cache: Dict[str, Any] = {}
 runners_cache: Dict[str, Any] = {}
 
+# Map agent names to paths (try agents/ first, then Day folders); built
+# once at import instead of on every cache miss
+AGENT_PATHS = {
+    "helpful_assistant": "agents/helpful_assistant",
+    "sample-agent": "agents/sample-agent",
+    "currency_agent": "agents/CurrencyAgent",
+    "image_agent": "agents/image_agent",
+    "shipping_agent": "agents/shipping_agent",
+    "research_agent": "agents/ResearchAgent",
+    "customer_support_agent": "agents/CustomerSupportAgent",
+    "product_catalog_agent": "agents/ProductCatalogAgent",
+    "weather_assistant": "agents/WeatherAssistant",
+}
+
+# Fallback to Day folders if agents/ doesn't exist
+FALLBACK_PATHS = {
+    "helpful_assistant": "Day1a/helpful_assistant",
+    "sample-agent": "Day1a/sample-agent",
+    "currency_agent": "Day2a/CurrencyAgent",
+    "image_agent": "Day2b/image_agent",
+    "shipping_agent": "Day2b/shipping_agent",
+    "research_agent": "Day4a/ResearchAgent",
+    "customer_support_agent": "Day5a/CustomerSupportAgent",
+    "product_catalog_agent": "Day5a/ProductCatalogAgent",
+    "weather_assistant": "Day5b/WeatherAssistant",
+}
+
+# Resolved once at import: prefer agents/, fall back to the Day folder.
+# One stat per agent at startup instead of a dict rebuild plus a stat on
+# every cache miss.
+AGENT_PATH: Dict[str, Path] = {
+    name: (
+        project_root / path
+        if (project_root / path).exists()
+        else project_root / FALLBACK_PATHS.get(name, path)
+    )
+    for name, path in AGENT_PATHS.items()
+}
+
+def _import_agent_module(agent_file: Path):
+    """Import an agent.py, reusing sys.modules on repeat loads."""
+    rel = agent_file.relative_to(project_root).with_suffix("")
+    if all(part.isidentifier() for part in rel.parts):
+        # Stable dotted path: import_module consults sys.modules first,
+        # so a repeat load is a dict hit instead of a fresh exec_module
+        return importlib.import_module(".".join(rel.parts))
+    
+    # Hyphenated folders (e.g. sample-agent) can't be dotted imports;
+    # fall back to a file-location spec but still cache under a unique
+    # sys.modules key so the module body only executes once
+    module_name = "_".join(part.replace("-", "_") for part in rel.parts)
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, agent_file)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return module
+
 def load_agent(agent_path: str):
     """Load an ADK agent from a directory path."""
     try:
-        # Import the agent module
         agent_dir = Path(agent_path)
         if not agent_dir.exists():
             raise FileNotFoundError(f"Agent directory not found: {agent_path}")
         
-        # Add project root and agent directory to path
-        sys.path.insert(0, str(project_root))
-        sys.path.insert(0, str(agent_dir))
+        # Register paths once: unguarded inserts grew sys.path on every
+        # load, turning later imports into O(n) scans
+        for entry in (str(project_root), str(agent_dir)):
+            if entry not in sys.path:
+                sys.path.insert(0, entry)
         
         # Try importing from agents/ directory first, then Day folders
         agent_name = agent_dir.name
         
-        # Try agents/ directory
-        agents_dir = project_root / "agents" / agent_name
-        if agents_dir.exists() and (agents_dir / "agent.py").exists():
-            spec = importlib.util.spec_from_file_location("agent", agents_dir / "agent.py")
-            agent_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(agent_module)
-        else:
+        agent_file = project_root / "agents" / agent_name / "agent.py"
+        if not agent_file.exists():
             # Try Day folder structure
             agent_file = agent_dir / "agent.py"
-            if agent_file.exists():
-                spec = importlib.util.spec_from_file_location("agent", agent_file)
-                agent_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(agent_module)
-            else:
+            if not agent_file.exists():
                 raise FileNotFoundError(f"No agent.py found in {agent_path}")
         
+        agent_module = _import_agent_module(agent_file)
+        
         if not hasattr(agent_module, "root_agent"):
             raise AttributeError(f"No root_agent found in {agent_path}")
         
@@ -97,44 +179,15 @@ def load_agent(agent_path: str):
 
 def get_agent(agent_name: str):
     """Get or load an agent by name."""
-    if agent_name not in agents_cache:
-        # Map agent names to paths (try agents/ first, then Day folders)
-        agent_paths = {
-            "helpful_assistant": "agents/helpful_assistant",
-            "sample-agent": "agents/sample-agent",
-            "currency_agent": "agents/CurrencyAgent",
-            "image_agent": "agents/image_agent",
-            "shipping_agent": "agents/shipping_agent",
-            "research_agent": "agents/ResearchAgent",
-            "customer_support_agent": "agents/CustomerSupportAgent",
-            "product_catalog_agent": "agents/ProductCatalogAgent",
-            "weather_assistant": "agents/WeatherAssistant",
-        }
-        
-        # Fallback to Day folders if agents/ doesn't exist
-        fallback_paths = {
-            "helpful_assistant": "Day1a/helpful_assistant",
-            "sample-agent": "Day1a/sample-agent",
-            "currency_agent": "Day2a/CurrencyAgent",
-            "image_agent": "Day2b/image_agent",
-            "shipping_agent": "Day2b/shipping_agent",
-            "research_agent": "Day4a/ResearchAgent",
-            "customer_support_agent": "Day5a/CustomerSupportAgent",
-            "product_catalog_agent": "Day5a/ProductCatalogAgent",
-            "weather_assistant": "Day5b/WeatherAssistant",
-        }
+    agent = agents_cache.get(agent_name)
+    if agent is None:
+        if agent_name not in AGENT_PATH:
+            raise ValueError(f"Unknown agent: {agent_name}. Available: {list(AGENT_PATH.keys())}")
         
-        if agent_name not in agent_paths:
-            raise ValueError(f"Unknown agent: {agent_name}. Available: {list(agent_paths.keys())}")
-        
-        # Try agents/ directory first, fallback to Day folders
-        agent_path = agent_paths[agent_name]
-        if not (project_root / agent_path).exists():
-            agent_path = fallback_paths.get(agent_name, agent_paths[agent_name])
-        
-        agents_cache[agent_name] = load_agent(str(project_root / agent_path))
+        # setdefault keeps the first loaded instance if two threads race
+        agent = agents_cache.setdefault(agent_name, load_agent(str(AGENT_PATH[agent_name])))
     
-    return agents_cache[agent_name]
+    return agent
 
 def get_runner(agent_name: str):
     """Get or create a runner for an agent."""
@@ -145,6 +198,46 @@ def get_runner(agent_name: str):
     
     return runners_cache[agent_name]
 
+# Per-agent locks so two simultaneous first requests don't both pay the
+# exec_module + InMemoryRunner cold load and discard one result
+_runner_locks: Dict[str, asyncio.Lock] = {}
+
+async def get_runner_async(agent_name: str):
+    """Get or create a runner without blocking the event loop."""
+    runner = runners_cache.get(agent_name)
+    if runner is not None:
+        return runner
+    lock = _runner_locks.setdefault(agent_name, asyncio.Lock())
+    async with lock:
+        if agent_name not in runners_cache:
+            # The cold load execs the agent module - blocking work, so it
+            # runs in a thread while the lock holds competing requests
+            await asyncio.to_thread(get_runner, agent_name)
+    return runners_cache[agent_name]
+
+@app.on_event("startup")
+async def warm_caches():
+    """
+    Pre-load agents before the first request arrives.
+
+    get_runner otherwise pays spec_from_file_location + exec_module inside
+    the first user's /chat latency. PRELOAD_AGENTS is a comma-separated
+    list of agent names; loads run in threads so they overlap.
+    """
+    names = [
+        name.strip()
+        for name in os.getenv("PRELOAD_AGENTS", "helpful_assistant").split(",")
+        if name.strip()
+    ]
+
+    async def _warm(name):
+        try:
+            await get_runner_async(name)
+        except Exception as e:
+            print(f"⚠️  Failed to preload agent '{name}': {e}")
+
+    await asyncio.gather(*(_warm(name) for name in names))
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -171,6 +264,14 @@ async def list_agents():
         ]
     }
 
+def _extract_text(response):
+    """Pull the final text out of a non-streaming runner response."""
+    if hasattr(response, 'messages') and response.messages:
+        return response.messages[-1].content if hasattr(response.messages[-1], 'content') else str(response.messages[-1])
+    if hasattr(response, 'content'):
+        return response.content
+    return str(response)
+
 @app.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """
@@ -183,20 +284,32 @@ async def chat(request: ChatRequest):
         agent_name = request.agent_name or "helpful_assistant"
         
         # Get runner for the agent
-        runner = get_runner(agent_name)
+        runner = await get_runner_async(agent_name)
         
-        # Run the agent
-        response = await runner.run(request.message)
-        
-        # Extract text response
-        if hasattr(response, 'messages') and response.messages:
-            response_text = response.messages[-1].content if hasattr(response.messages[-1], 'content') else str(response.messages[-1])
-        elif hasattr(response, 'content'):
-            response_text = response.content
+        # Prefer the async event pipeline: run_async lets ADK overlap a
+        # sub-agent's tool I/O (e.g. the A2A catalog HTTP call) with
+        # continued model generation, where a single blocking run call
+        # serializes the two. The joined stream is the full response.
+        if hasattr(runner, "run_async"):
+            response_text = "".join(
+                [chunk async for chunk in _stream_chunks(
+                    runner, request.message, request.conversation_id
+                )]
+            )
+        # Fallback for runners without run_async. If runner.run is
+        # synchronous under the hood, awaiting it on the loop would
+        # starve every other in-flight request while it does
+        # tokenizer/tool work - push it to a worker thread.
+        elif inspect.iscoroutinefunction(type(runner).run):
+            response = await runner.run(request.message)
+            response_text = _extract_text(response)
         else:
-            response_text = str(response)
+            response = await asyncio.to_thread(runner.run, request.message)
+            response_text = _extract_text(response)
         
-        return ChatResponse(
+        # model_construct skips pydantic validation: the fields are
+        # internally built and already the right types
+        return ChatResponse.model_construct(
             response=response_text,
             agent_name=agent_name,
             conversation_id=request.conversation_id
@@ -204,23 +317,114 @@ async def chat(request: ChatRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error running agent: {str(e)}")
 
+def _sse_event(chunk: str) -> str:
+    """
+    Frame one text chunk as a Server-Sent Events data event.
+
+    SSE parses each line separately: text after an embedded newline
+    would be read as an unknown field and silently dropped by compliant
+    clients, so every line of the chunk gets its own data: prefix.
+    """
+    return "".join(f"data: {line}\n" for line in chunk.split("\n")) + "\n"
+
+async def _stream_chunks(runner, message: str, conversation_id: Optional[str]):
+    """
+    Yield the agent's response text in ~50ms windows as it is generated.
+
+    Yielding every raw model chunk pays per-chunk HTTP framing and write
+    overhead; batching into short windows keeps time-to-first-token low
+    while cutting the chunk count by an order of magnitude.
+    """
+    from google.genai import types
+
+    user_id = "api_user"
+    session_id = conversation_id or f"stream_{uuid.uuid4().hex[:8]}"
+    session = await runner.session_service.get_session(
+        app_name=runner.app_name, user_id=user_id, session_id=session_id
+    )
+    if session is None:
+        await runner.session_service.create_session(
+            app_name=runner.app_name, user_id=user_id, session_id=session_id
+        )
+
+    content = types.Content(role="user", parts=[types.Part(text=message)])
+    buf = []
+    last_flush = time.monotonic()
+    async for event in runner.run_async(
+        user_id=user_id, session_id=session_id, new_message=content
+    ):
+        if event.content and event.content.parts:
+            text = "".join(p.text for p in event.content.parts if p.text)
+            if text:
+                buf.append(text)
+        if buf and time.monotonic() - last_flush > 0.05:
+            yield "".join(buf)
+            buf.clear()
+            last_flush = time.monotonic()
+    if buf:
+        yield "".join(buf)
+
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Stream a chat response as the agent generates it.
+
+    /chat buffers the full response, so time-to-first-byte equals total
+    generation time. This endpoint starts emitting text as soon as the
+    first window fills; /chat stays as-is for non-streaming clients.
+    """
+    try:
+        agent_name = request.agent_name or "helpful_assistant"
+        runner = await get_runner_async(agent_name)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error running agent: {str(e)}")
+    async def _sse():
+        async for chunk in _stream_chunks(
+            runner, request.message, request.conversation_id
+        ):
+            yield _sse_event(chunk)
+
+    return StreamingResponse(_sse(), media_type="text/event-stream")
+
 @app.post("/chat/{agent_name}")
 async def chat_with_agent(agent_name: str, request: ChatRequest):
     """Chat with a specific agent (alternative endpoint)."""
     request.agent_name = agent_name
     return await chat(request)
 
+# Tool names are static for the process lifetime; compute the tuple once
+# per agent instead of reflecting over agent.tools on every rebuild
+_tool_names_cache = {}
+
+def _tool_names(agent):
+    """Return the agent's tool names, computed once per agent instance."""
+    names = _tool_names_cache.get(id(agent))
+    if names is None:
+        names = tuple(
+            getattr(tool, 'name', None) or repr(tool)
+            for tool in getattr(agent, 'tools', ())
+        )
+        _tool_names_cache[id(agent)] = names
+    return names
+
+@functools.lru_cache(maxsize=32)
+def _build_agent_info(agent_name: str, bucket: int):
+    """Build the info payload; the time bucket expires entries every 60s."""
+    agent = get_agent(agent_name)
+    return {
+        "name": agent_name,
+        "description": getattr(agent, 'description', 'No description'),
+        "model": getattr(agent, 'model', 'Unknown'),
+        "tools": list(_tool_names(agent))
+    }
+
 @app.get("/agents/{agent_name}/info")
 async def agent_info(agent_name: str):
     """Get information about a specific agent."""
     try:
-        agent = get_agent(agent_name)
-        return {
-            "name": agent_name,
-            "description": getattr(agent, 'description', 'No description'),
-            "model": getattr(agent, 'model', 'Unknown'),
-            "tools": [tool.name for tool in getattr(agent, 'tools', [])] if hasattr(agent, 'tools') else []
-        }
+        # Agent metadata is static at runtime, so chatty discovery clients
+        # hit the memoized payload instead of re-walking agent.tools
+        return _build_agent_info(agent_name, int(time.monotonic() // 60))
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Agent not found: {str(e)}")
 
@@ -229,6 +433,7 @@ if __name__ == "__main__":
     
     # Cloud Run sets PORT environment variable
     port = int(os.getenv("PORT", os.getenv("API_PORT", "8000")))
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
     host = os.getenv("API_HOST", "0.0.0.0")
     
     print(f"""
@@ -258,5 +463,16 @@ if __name__ == "__main__":
     4. Use /chat endpoint for conversations
     """)
     
-    uvicorn.run(app, host=host, port=port)
+    # WEB_CONCURRENCY>1 runs parallel worker interpreters so concurrent
+    # requests stop serializing on one GIL. Workers need the app as an
+    # import string to re-import it per process; the agent/runner caches
+    # are module globals, so each worker fills its own lazily.
+    uvicorn.run(
+        app if workers == 1 else "agents-api-server:app",
+        host=host,
+        port=port,
+        loop=LOOP_IMPL,
+        http=HTTP_IMPL,
+        workers=workers
+    )
 
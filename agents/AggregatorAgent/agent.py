@@ -19,12 +19,17 @@ from utility.logging_config import setup_adk_logging, ensure_debug_logging
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="AggregatorAgent", file_only=True)
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,  # Initial delay before first retry (in seconds)
-    http_status_codes=[429, 500, 503, 504]  # Retry on these HTTP errors
-)
+# Shared retry policy (falls back to a local literal when utility is absent)
+try:
+    from utility.retry_config import RETRY_CONFIG as retry_config
+except ImportError:
+    retry_config = types.HttpRetryOptions(
+        attempts=5,
+        exp_base=2,
+        initial_delay=0.5,
+        max_delay=30,
+        http_status_codes=[429, 500, 503, 504],
+    )
 aggregator_agent = Agent(
     name="AggregatorAgent",
     model=Gemini(
@@ -8,8 +8,9 @@ load_dotenv()
 
 # Configure logging for ADK using utility module
 # Add project root to path to enable utility imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
 
@@ -17,8 +18,9 @@ from utility.logging_config import setup_adk_logging, ensure_debug_logging
 setup_adk_logging(agent_name="BlogPipeline", file_only=True)
 
 # Add Day1b directory to path to import sub-agents
-day1b_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(day1b_dir))
+day1b_dir = str(Path(__file__).parent.parent)
+if day1b_dir not in sys.path:
+    sys.path.insert(0, day1b_dir)
 
 from OutlineAgent.agent import outline_agent
 from WriterAgent.agent import writer_agent
@@ -9,6 +9,7 @@ from the external Product Catalog Agent.
 
 import os
 import sys
+import time
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -24,8 +25,9 @@ from google.genai import types
 load_dotenv()
 
 # Add project root to path for utility imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 try:
     from utility.logging_config import setup_adk_logging, ensure_debug_logging
@@ -33,24 +35,82 @@ try:
 except ImportError:
     print("Warning: Could not import logging config")
 
-# Configure retry options
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,
-    http_status_codes=[429, 500, 503, 504],  # Retry on these HTTP errors
-)
+# Shared retry policy (falls back to a local literal when utility is absent)
+try:
+    from utility.retry_config import RETRY_CONFIG as retry_config
+except ImportError:
+    retry_config = types.HttpRetryOptions(
+        attempts=5,
+        exp_base=2,
+        initial_delay=0.5,
+        max_delay=30,
+        http_status_codes=[429, 500, 503, 504],
+    )
 
 # Get Product Catalog Agent URL from environment or use default
 PRODUCT_CATALOG_URL = os.getenv("PRODUCT_CATALOG_URL", "http://localhost:8001")
 
+# How long a fetched agent card stays fresh. Capabilities rarely change
+# within a process lifetime, so re-fetching per resolution is wasted HTTP.
+A2A_CARD_TTL_SECONDS = int(os.getenv("A2A_CARD_TTL_SECONDS", "60"))
+
+_card_cache = {}
+
+
+def _resolve_agent_card(card_url: str):
+    """
+    Fetch the A2A agent card once and cache it for A2A_CARD_TTL_SECONDS.
+
+    Handing RemoteA2aAgent a pre-resolved card skips the HTTP round trip
+    it would otherwise pay to resolve the URL itself. If the catalog
+    server isn't reachable yet, fall back to the raw URL so ADK resolves
+    it lazily exactly as before.
+    """
+    cached = _card_cache.get(card_url)
+    if cached is not None and time.monotonic() - cached[1] < A2A_CARD_TTL_SECONDS:
+        return cached[0]
+    try:
+        import httpx
+        from a2a.types import AgentCard
+
+        card = AgentCard.model_validate(httpx.get(card_url, timeout=5.0).json())
+    except Exception:
+        # Stale card beats a URL that triggers a fetch per resolution
+        return cached[0] if cached is not None else card_url
+    _card_cache[card_url] = (card, time.monotonic())
+    return card
+
+
+def _build_a2a_client():
+    """
+    One pooled async HTTP client for all A2A traffic.
+
+    Without a shared client every tool invocation can pay TCP + TLS
+    setup; keep-alive pooling amortizes that, and HTTP/2 multiplexes
+    concurrent tool calls over a single connection when the h2 extra is
+    installed (falls back to HTTP/1.1 pooling when it isn't).
+    """
+    import httpx
+
+    limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    try:
+        return httpx.AsyncClient(http2=True, limits=limits, timeout=30.0)
+    except ImportError:
+        return httpx.AsyncClient(limits=limits, timeout=30.0)
+
+
+_shared_a2a_client = _build_a2a_client()
+
 # Create a RemoteA2aAgent that connects to our Product Catalog Agent
 # This acts as a client-side proxy - the Customer Support Agent can use it like a local agent
 remote_product_catalog_agent = RemoteA2aAgent(
     name="product_catalog_agent",
     description="Remote product catalog agent from external vendor that provides product information.",
-    # Point to the agent card URL - this is where the A2A protocol metadata lives
-    agent_card=f"{PRODUCT_CATALOG_URL}{AGENT_CARD_WELL_KNOWN_PATH}",
+    # The card is pre-resolved (and TTL-cached) so ADK gets the metadata
+    # without its own round trip to the well-known path
+    agent_card=_resolve_agent_card(f"{PRODUCT_CATALOG_URL}{AGENT_CARD_WELL_KNOWN_PATH}"),
+    # Reuse the pooled client instead of letting ADK build one per proxy
+    httpx_client=_shared_a2a_client,
 )
 
 print("✅ Remote Product Catalog Agent proxy created!")
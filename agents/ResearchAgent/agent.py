@@ -8,6 +8,7 @@ This agent shows:
 - How to identify and fix agent issues
 """
 
+import functools
 import os
 import sys
 from pathlib import Path
@@ -24,8 +25,9 @@ from google.adk.tools.google_search_tool import google_search
 load_dotenv()
 
 # Add project root to path for utility imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 try:
     from utility.logging_config import setup_adk_logging, ensure_debug_logging
@@ -33,13 +35,32 @@ try:
 except ImportError:
     print("Warning: Could not import logging config")
 
-# Configure retry options
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,
-    http_status_codes=[429, 500, 503, 504],  # Retry on these HTTP errors
-)
+# Shared retry policy (falls back to a local literal when utility is absent)
+try:
+    from utility.retry_config import RETRY_CONFIG as retry_config
+except ImportError:
+    retry_config = types.HttpRetryOptions(
+        attempts=5,
+        exp_base=2,
+        initial_delay=0.5,
+        max_delay=30,
+        http_status_codes=[429, 500, 503, 504],
+    )
+
+
+# One Gemini instance for both agents: each construction otherwise owns
+# its own HTTP client, auth-token cache and retry state. The google-genai
+# client is designed for concurrent reuse, so sharing is safe.
+try:
+    from utility.llm_client import get_shared_gemini
+    _shared_llm = get_shared_gemini("gemini-2.5-flash-lite")
+except ImportError:
+    _shared_llm = Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config)
+
+
+@functools.lru_cache(maxsize=128)
+def _count_papers_cached(papers: tuple) -> int:
+    return len(papers)
 
 
 def count_papers(papers: List[str]) -> int:
@@ -51,13 +72,15 @@ def count_papers(papers: List[str]) -> int:
     Returns:
       The number of papers in the list.
     """
-    return len(papers)
+    # Memoized on the tuple of papers: a model that re-issues the same
+    # tool call in a session gets a cache hit instead of a fresh dispatch
+    return _count_papers_cached(tuple(papers))
 
 
 # Google Search agent
 google_search_agent = LlmAgent(
     name="google_search_agent",
-    model=Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config),
+    model=_shared_llm,
     description="Searches for information using Google search",
     instruction="""Use the google_search tool to find information on the given topic. Return the raw search results.
     If the user asks for a list of papers, then give them the list of research papers you found and not the summary.""",
@@ -69,7 +92,7 @@ print("✅ Google Search Agent created")
 # Root agent - Research Paper Finder
 research_agent = LlmAgent(
     name="research_paper_finder_agent",
-    model=Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config),
+    model=_shared_llm,
     instruction="""Your task is to find research papers and count them. 
 
     You MUST ALWAYS follow these steps:
@@ -1,3 +1,6 @@
+import concurrent.futures
+import functools
+import logging
 import uuid
 from google.genai import types
 import sys
@@ -16,43 +19,84 @@ from mcp import StdioServerParameters
 
 from google.adk.apps.app import App, ResumabilityConfig
 from google.adk.tools.function_tool import FunctionTool
-import base64
 import json
+import re
+
+# pybase64 wraps a SIMD base64 codec (multi-GB/s vs the scalar stdlib
+# loop); same API, so it drops straight in when installed
+try:
+    from pybase64 import b64decode as _b64decode
+except ImportError:
+    from base64 import b64decode as _b64decode
+
+# orjson's SIMD-style C parser is several times faster than stdlib json
+# on the large base64-heavy payloads MCP image tools return; stdlib json
+# stays as the fallback when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Load environment variables from .env file
 load_dotenv()
 
 # Configure logging for ADK using utility module
 # Add project root to path to enable utility imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
 
 # Setup logging - reads ADK_LOG_LEVEL from .env or defaults to DEBUG
 setup_adk_logging(agent_name="image_agent", file_only=True)
-retry_config = types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,
-    http_status_codes=[429, 500, 503, 504],  # Retry on these HTTP errors
-)
-# MCP integration with Everything Server
-mcp_image_server = McpToolset(
-    connection_params=StdioConnectionParams(
-        server_params=StdioServerParameters(
-            command="npx",  # Run MCP server via npx
-            args=[
-                "-y",  # Argument for npx to auto-confirm install
-                "@modelcontextprotocol/server-everything",
-            ],
-            tool_filter=["getTinyImage"],
-        ),
-        timeout=30,
+# Shared retry policy (falls back to a local literal when utility is absent)
+try:
+    from utility.retry_config import RETRY_CONFIG as retry_config
+except ImportError:
+    retry_config = types.HttpRetryOptions(
+        attempts=5,
+        exp_base=2,
+        initial_delay=0.5,
+        max_delay=30,
+        http_status_codes=[429, 500, 503, 504],
     )
+# MCP integration with Everything Server, created lazily in _build_agent:
+# instantiating the toolset at import spawned an npx subprocess per
+# worker before any request arrived
+
+def _err_detail(e: Exception) -> str:
+    """Exception text for diagnostics; just the type name unless DEBUG is on."""
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        return str(e)
+    return type(e).__name__
+
+
+# Cheap validity check: the full-decode round trip only existed to
+# verify the base64, but the markdown URI re-embeds the original string
+_B64_RE = re.compile(r'^[A-Za-z0-9+/=\s]+$')
+
+# Fused fast path over serialized payloads: one regex pass both locates
+# the "data" field and proves its base64 alphabet, replacing the full
+# JSON parse, the dict walk and the separate validity check - three
+# scans over a multi-MB string collapsed into one.
+_DATA_RE = re.compile(r'"data"\s*:\s*"([A-Za-z0-9+/=]+)"')
+_DATA_RE_B = re.compile(rb'"data"\s*:\s*"([A-Za-z0-9+/=]+)"')
+
+# Magic signatures scanned in one C-level tuple pass. WebP files start
+# with a RIFF container header, not the literal WEBP - the old
+# startswith(b'WEBP') check could never match a real file.
+_SIGS = (
+    (b"\xff\xd8", "jpeg"),
+    (b"\x89PNG", "png"),
+    (b"GIF", "gif"),
+    (b"RIFF", "webp"),
 )
 
-print("✅ MCP Tool created")
+# Pre-built markdown/data-URI prefixes, one per sniffable format. The
+# f-string route ran the payload through the formatting machinery; a
+# plain prefix + payload + ")" concat is one bulk copy.
+_URI_PREFIX = {fmt: f"![Generated Image](data:image/{fmt};base64," for _, fmt in _SIGS}
 
 # Function to format image response for ADK web display
 def format_image_for_display(image_response: str) -> str:
@@ -67,43 +111,66 @@ def format_image_for_display(image_response: str) -> str:
         Formatted markdown string with embedded image using data URI
     """
     try:
-        # Parse JSON if it's a string
-        if isinstance(image_response, str):
-            try:
-                parsed = json.loads(image_response)
-                image_response = parsed
-            except:
-                # If not JSON, might be base64 directly
-                pass
+        # Fast path: the MCP SDK hands back parsed objects on most code
+        # paths, so dicts skip the JSON round-trip entirely. Only actual
+        # str/bytes payloads get parsed.
+        if isinstance(image_response, (str, bytes, bytearray)):
+            # Serialized JSON objects first try the fused single-scan
+            # extraction; anything it can't place falls back to the
+            # full parse below
+            stripped = image_response.lstrip()
+            if stripped[:1] in ("{", b"{"):
+                match = (
+                    _DATA_RE_B.search(image_response)
+                    if isinstance(image_response, (bytes, bytearray))
+                    else _DATA_RE.search(image_response)
+                )
+                if match is not None:
+                    image_response = {"data": match.group(1)}
+            if not isinstance(image_response, dict):
+                try:
+                    image_response = orjson.loads(image_response) if orjson is not None else json.loads(image_response)
+                except Exception:
+                    # If not JSON, might be base64 directly
+                    pass
         
         # Extract image data from various possible response formats
         image_data = None
         
+        # Peel nested {"response": ...} envelopes iteratively; the old
+        # code re-entered the whole function (and its parse) per level
+        while (
+            isinstance(image_response, dict)
+            and "response" in image_response
+            and not ("content" in image_response or "data" in image_response or "image" in image_response)
+        ):
+            image_response = image_response["response"]
+            if isinstance(image_response, (str, bytes, bytearray)):
+                try:
+                    image_response = orjson.loads(image_response) if orjson is not None else json.loads(image_response)
+                except Exception:
+                    pass
+        
         if isinstance(image_response, dict):
-            # Try different possible keys
-            if "content" in image_response:
-                content = image_response["content"]
-                if isinstance(content, list):
-                    for item in content:
-                        if isinstance(item, dict):
-                            if item.get("type") == "image" and "data" in item:
-                                image_data = item["data"]
-                                break
-                            elif "data" in item:
-                                image_data = item["data"]
-                                break
-                elif isinstance(content, dict):
-                    if content.get("type") == "image" and "data" in content:
-                        image_data = content["data"]
-                    elif "data" in content:
-                        image_data = content["data"]
-            elif "data" in image_response:
-                image_data = image_response["data"]
-            elif "image" in image_response:
-                image_data = image_response["image"]
-            elif "response" in image_response:
-                # Recursively check
-                return format_image_for_display(image_response["response"])
+            # One list-as-stack walk replaces the nested isinstance
+            # ladder over content/data/image: a single loop, no Python
+            # frames per nesting level, and it reaches the same keys at
+            # any depth of MCP envelope
+            stack = [image_response]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, dict):
+                    if "data" in node:
+                        image_data = node["data"]
+                        break
+                    if "image" in node:
+                        image_data = node["image"]
+                        break
+                    # reversed() keeps list items in original order on
+                    # the LIFO stack so the first match still wins
+                    stack.extend(reversed(list(node.values())))
+                elif isinstance(node, list):
+                    stack.extend(reversed(node))
         elif isinstance(image_response, str):
             # Might be base64 directly
             image_data = image_response
@@ -111,37 +178,70 @@ def format_image_for_display(image_response: str) -> str:
         if image_data:
             # Verify and format
             try:
-                # Decode to verify it's valid base64
-                decoded = base64.b64decode(image_data)
+                # Normalize to an ASCII str up front: base64 is ASCII by
+                # construction, so the result stays a compact UCS-1
+                # string and the eventual UTF-8 encode in the HTTP layer
+                # is a straight memcpy. (ADK tool results must be str,
+                # which rules out returning bytes outright.)
+                if isinstance(image_data, (bytes, bytearray)):
+                    image_data = image_data.decode('ascii')
+                # Decode only the first quantum for the magic sniff: the
+                # old full decode allocated (and immediately threw away)
+                # the whole image just to look at the leading bytes
+                if isinstance(image_data, str) and not _B64_RE.match(image_data):
+                    raise ValueError("not base64 data")
+                head_b64 = image_data[:16]
+                pad = "=" * (-len(head_b64) % 4)
+                head = _b64decode(head_b64 + pad if isinstance(head_b64, str) else head_b64 + pad.encode())
                 
-                # Determine image format
-                if decoded.startswith(b'\xff\xd8'):
-                    fmt = "jpeg"
-                elif decoded.startswith(b'\x89PNG'):
-                    fmt = "png"
-                elif decoded.startswith(b'GIF'):
-                    fmt = "gif"
-                elif decoded.startswith(b'WEBP'):
-                    fmt = "webp"
-                else:
-                    fmt = "png"  # Default
+                # Determine image format (default: png)
+                fmt = next((f for p, f in _SIGS if head.startswith(p)), "png")
                 
                 # Return markdown with data URI
-                return f"![Generated Image](data:image/{fmt};base64,{image_data})"
+                return _URI_PREFIX[fmt] + image_data + ")"
             except Exception as e:
-                return f"Image data received but could not be decoded: {str(e)}"
+                return f"Image data received but could not be decoded: {_err_detail(e)}"
         
         return "Image generation completed, but image data not found in expected format."
     
     except Exception as e:
-        return f"Error formatting image: {str(e)}"
+        return f"Error formatting image: {_err_detail(e)}"
 
 # Create image agent with MCP integration
 # Updated instruction to format image responses for web display
-image_agent = LlmAgent(
-    model=Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config),
-    name="image_agent",
-    instruction="""You are an image generation assistant. When users request images:
+@functools.cache
+def _build_agent():
+    """Create the MCP toolset and agent once, on first attribute access."""
+    # The MCP spawn (npx subprocess) and the Gemini construction (HTTP
+    # client and auth setup) are independent and both I/O-bound, so
+    # overlapping them costs the slower of the two instead of the sum
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        mcp_future = executor.submit(
+            McpToolset,
+            connection_params=StdioConnectionParams(
+                server_params=StdioServerParameters(
+                    command="npx",  # Run MCP server via npx
+                    args=[
+                        "-y",  # Argument for npx to auto-confirm install
+                        "@modelcontextprotocol/server-everything",
+                    ],
+                    tool_filter=["getTinyImage"],
+                ),
+                timeout=30,
+            ),
+        )
+        gemini_future = executor.submit(
+            Gemini, model="gemini-2.5-flash-lite", retry_options=retry_config
+        )
+        mcp_image_server = mcp_future.result()
+        gemini = gemini_future.result()
+
+    print("✅ MCP Tool created")
+
+    image_agent = LlmAgent(
+        model=gemini,
+        name="image_agent",
+        instruction="""You are an image generation assistant. When users request images:
 
 CRITICAL: When the getTinyImage tool returns a response, you MUST:
 1. Extract the base64-encoded image data from the tool response
@@ -159,13 +259,25 @@ IMPORTANT:
 - Do NOT just say "here is the image" - you MUST include the actual image markdown
 - The ADK web interface will automatically render images formatted this way
 - If you cannot find the image data, describe what the tool returned so we can debug""",
-    tools=[mcp_image_server],
-)
+        tools=[mcp_image_server],
+    )
+
+    print("✅ image_agent created.")
+
+    # Ensure logging is maintained after agent creation
+    ensure_debug_logging(agent_name="image_agent")
 
-print("✅ image_agent created.")
+    return mcp_image_server, image_agent
 
-# Define root_agent at module level for ADK web server
-root_agent = image_agent
 
-# Ensure logging is maintained after agent creation
-ensure_debug_logging(agent_name="image_agent")
\ No newline at end of file
+def __getattr__(name):
+    # PEP 562 lazy exports: importing this module no longer spawns the
+    # MCP server or builds the Gemini client - the first access to
+    # root_agent (e.g. by the ADK web server) does, once per process
+    if name in ("mcp_image_server", "image_agent", "root_agent"):
+        mcp_image_server, image_agent = _build_agent()
+        globals()["mcp_image_server"] = mcp_image_server
+        globals()["image_agent"] = image_agent
+        globals()["root_agent"] = image_agent
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,4 +1,5 @@
 from google.adk.agents.llm_agent import Agent
+import functools
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -9,8 +10,9 @@ load_dotenv()
 
 # Configure logging for ADK using utility module
 # Add parent directory to path to enable utility imports
-parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+parent_dir = str(Path(__file__).parent.parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
 from utility.logging_config import setup_adk_logging, ensure_debug_logging
 
@@ -38,20 +40,35 @@ def get_weather_in_london() -> Dict[str, Any]:
         "report": "The weather in London is partly cloudy with a temperature of 15°C (59°F). Light cloud cover with occasional sunshine. Humidity is 65% and wind speed is 10 km/h."
     }
 
-# Define root_agent at module level for ADK web server
-root_agent = Agent(
-    model='gemini-2.5-flash-lite',
-    name='sample-agent',
-    description='A helpful assistant for user questions with weather information capabilities.',
-    instruction='''Answer user questions to the best of your knowledge. 
+# root_agent is built lazily so importing the module (and with it the
+# Gemini client setup) costs nothing until the ADK web server first
+# asks for the agent
+@functools.cache
+def _build_agent():
+    """Create the agent once, on first attribute access."""
+    agent = Agent(
+        model='gemini-2.5-flash-lite',
+        name='sample-agent',
+        description='A helpful assistant for user questions with weather information capabilities.',
+        instruction='''Answer user questions to the best of your knowledge. 
 
 When users ask about the weather in London:
 1. Use the get_weather_in_london tool to fetch current weather information
 2. Respond in a friendly, conversational tone with the weather details
 
 Be helpful and concise in your responses.''',
-    tools=[get_weather_in_london],
-)
+        tools=[get_weather_in_london],
+    )
 
-# Ensure logging is maintained after agent creation
-ensure_debug_logging(agent_name="sample-agent")
+    # Ensure logging is maintained after agent creation
+    ensure_debug_logging(agent_name="sample-agent")
+
+    return agent
+
+
+def __getattr__(name):
+    # PEP 562 lazy export for the ADK web server
+    if name == "root_agent":
+        agent = globals()["root_agent"] = _build_agent()
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,17 @@
+"""
+Repo-root bootstrap for Python processes started from this directory.
+
+Python imports `sitecustomize` automatically at interpreter startup when it is
+found on sys.path, so running any script or `adk web` from the repo root makes
+the repo root importable (for `utility.*` and the Day* packages) without each
+agent module mutating sys.path itself. Each sys.path.insert invalidates the
+import system's path caches, so doing this once per process beats doing it
+once per agent module.
+"""
+
+import os
+import sys
+
+_REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
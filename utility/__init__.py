@@ -3,7 +3,7 @@ Utility module for 5-day-agents project.
 Contains reusable functions for logging, configuration, etc.
 """
 
-from .logging_config import setup_adk_logging
+from .logging_config import setup_adk_logging, ensure_debug_logging
 
-__all__ = ['setup_adk_logging']
+__all__ = ['setup_adk_logging', 'ensure_debug_logging']
 
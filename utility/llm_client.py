@@ -0,0 +1,130 @@
+"""
+Shared Gemini model/client utility for ADK agents.
+
+Every agent module used to build its own `Gemini(...)` instance plus its own
+`HttpRetryOptions`, which meant one httpx client, connection pool, and auth
+token fetch per agent at import time. This module memoizes a single shared
+`Gemini` instance (and therefore a single underlying HTTP client/connection
+pool) that all agents reuse, so only the first agent pays the cold-start cost.
+
+Usage:
+    >>> from utility.llm_client import get_shared_gemini
+    >>> root_agent = Agent(name="MyAgent", model=get_shared_gemini(), ...)
+"""
+
+import functools
+import logging
+import os
+
+from google.adk.models.google_llm import Gemini
+from google.genai import types
+
+from utility.retry_config import RETRY_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Default model used across all agents in this repo. Override via env var
+# if an agent needs a different model without touching every module.
+DEFAULT_MODEL = os.environ.get('ADK_MODEL', 'gemini-2.5-flash-lite')
+
+# Single shared retry policy (one object instead of one per agent module).
+retry_config = RETRY_CONFIG
+
+
+# Latency mode for interactive serving. Vertex AI doesn't expose a
+# Bedrock-style performanceConfig.latency flag, so "optimized" maps to the
+# closest Gemini knob: disabling thinking, which cuts time-to-first-token.
+# Leave unset for batch jobs (e.g. outline generation) to keep the default.
+LATENCY_MODE = os.environ.get('LLM_LATENCY_MODE', '').lower()
+
+
+# Context caching: static agent instructions are re-sent (and re-prefilled)
+# verbatim on every request. With ADK_CONTEXT_CACHE=1, instructions are
+# uploaded once as Gemini cachedContent and referenced by handle, so the
+# model reuses the KV cache for the shared prefix (and Vertex discounts the
+# cached tokens). Off by default: caches have a minimum token count, and the
+# short instructions in this repo may not qualify.
+CONTEXT_CACHE_ENABLED = os.environ.get('ADK_CONTEXT_CACHE', '').upper() in ('1', 'TRUE', 'YES')
+CONTEXT_CACHE_TTL = os.environ.get('ADK_CONTEXT_CACHE_TTL', '3600s')
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cached_content(model: str, instruction: str):
+    """Upload an instruction as cachedContent once; returns its handle or None."""
+    from google import genai
+    try:
+        client = genai.Client()
+        cache = client.caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                system_instruction=instruction,
+                ttl=CONTEXT_CACHE_TTL,
+            ),
+        )
+        return cache.name
+    except Exception as exc:  # e.g. instruction below the minimum token count
+        logger.warning("context cache creation failed, sending instruction inline: %s", exc)
+        return None
+
+
+def get_generate_content_config(instruction: str = None, model: str = DEFAULT_MODEL,
+                                has_tools: bool = False):
+    """
+    Return the shared GenerateContentConfig for the current latency mode.
+
+    With LLM_LATENCY_MODE=optimized, returns a config that disables thinking
+    to reduce time-to-first-token on interactive requests. With
+    ADK_CONTEXT_CACHE=1 and an instruction supplied, the instruction is
+    uploaded once as cachedContent and referenced by handle so its prefill
+    is reused across requests. Otherwise returns None, leaving defaults
+    untouched.
+
+    The API rejects any request that combines cached_content with tool
+    declarations, so agents that carry tools must pass has_tools=True to
+    keep their instruction inline. Agents that do opt in must also route
+    their instruction through get_inline_instruction() - sending it both
+    ways fails the same check.
+    """
+    config_kwargs = {}
+    if LATENCY_MODE == 'optimized':
+        config_kwargs['thinking_config'] = types.ThinkingConfig(thinking_budget=0)
+    if CONTEXT_CACHE_ENABLED and instruction and not has_tools:
+        cached_content = _get_cached_content(model, instruction)
+        if cached_content:
+            config_kwargs['cached_content'] = cached_content
+    return types.GenerateContentConfig(**config_kwargs) if config_kwargs else None
+
+
+def get_inline_instruction(instruction: str, config) -> str:
+    """
+    Return the instruction an agent should pass inline alongside `config`.
+
+    When the config references the instruction as cachedContent, the agent
+    must not also set it inline: ADK copies the config into the request and
+    then adds system_instruction, and the API rejects cached_content
+    combined with system_instruction. The cached prefix serves instead.
+    """
+    if config is not None and getattr(config, 'cached_content', None):
+        return ''
+    return instruction
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_gemini(model: str = DEFAULT_MODEL) -> Gemini:
+    """
+    Return the shared Gemini model instance for the given model name.
+
+    The instance (and its underlying HTTP client and connection pool) is
+    created on first use and memoized, so all agents share one warm
+    connection pool instead of each paying their own TLS/auth cold start.
+
+    Args:
+        model: Gemini model name (default: DEFAULT_MODEL)
+
+    Returns:
+        A memoized Gemini instance configured with the shared retry policy.
+    """
+    return Gemini(
+        model=model,
+        retry_options=retry_config
+    )
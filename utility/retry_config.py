@@ -0,0 +1,20 @@
+"""
+Shared HTTP retry policy for ADK agents.
+
+Every agent module used to construct its own HttpRetryOptions literal (plus
+its own status-code list) at import time. This module holds the one shared,
+frozen instance so the retry policy is a single knob and importing modules
+allocate nothing.
+"""
+
+from google.genai import types
+
+# exp_base=2 with a 30s delay cap keeps worst-case total backoff under a
+# minute; the old exp_base=7 policy backed off 1, 7, 49, 343, 2401 seconds.
+RETRY_CONFIG = types.HttpRetryOptions(
+    attempts=5,  # Maximum retry attempts
+    exp_base=2,  # Delay multiplier
+    initial_delay=0.5,  # Initial delay before first retry (in seconds)
+    max_delay=30,  # Cap on any single backoff delay (in seconds)
+    http_status_codes=[429, 500, 503, 504]  # Retry on these HTTP errors
+)
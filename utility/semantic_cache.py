@@ -0,0 +1,176 @@
+"""
+Semantic cache for ADK agent invocations.
+
+Research-style agents (HealthResearcher, ResearchAgent) pay a full
+google_search + Gemini round trip per query, even when the new query is just a
+paraphrase of one they already answered ("medical breakthroughs 2024" vs
+"recent medical advances"). This module caches agent responses keyed by a
+query embedding: if a new query's cosine similarity against a cached query
+exceeds the threshold, the cached response is returned and the entire LLM +
+search round trip is skipped.
+
+The embedding model (sentence-transformers) and numpy are optional
+dependencies — if either is missing the cache silently disables itself and
+agents behave exactly as before.
+
+Usage:
+    >>> from utility.semantic_cache import make_semantic_cache_callbacks
+    >>> before_cb, after_cb = make_semantic_cache_callbacks(ttl_seconds=86400)
+    >>> agent = Agent(..., before_agent_callback=before_cb, after_agent_callback=after_cb)
+"""
+
+import logging
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+# Cosine similarity above which two queries are treated as the same question.
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+
+# Default time-to-live for cached responses. Research-style answers stay
+# useful for a day; pass a short TTL for fast-moving queries (e.g. weather).
+DEFAULT_TTL_SECONDS = 24 * 3600
+
+# Optional dependencies: disable the cache rather than fail if unavailable.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_EMBEDDING_MODEL_NAME = 'sentence-transformers/all-MiniLM-L6-v2'
+_embedding_model = None
+_embedding_model_lock = threading.Lock()
+
+
+def _get_embedding_model():
+    """Lazily load the sentence-transformers model (None if unavailable)."""
+    global _embedding_model
+    if _embedding_model is not None:
+        return _embedding_model
+    with _embedding_model_lock:
+        if _embedding_model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+                _embedding_model = SentenceTransformer(_EMBEDDING_MODEL_NAME)
+            except ImportError:
+                logger.debug(
+                    "sentence-transformers not installed; semantic cache disabled"
+                )
+                _embedding_model = False  # Sentinel: tried and unavailable
+    return _embedding_model
+
+
+def _embed(text: str):
+    """Return a unit-norm embedding for text, or None if embeddings are off."""
+    model = _get_embedding_model()
+    if not model or np is None:
+        return None
+    vector = model.encode(text)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class SemanticCache:
+    """
+    In-memory semantic cache mapping query embeddings to responses.
+
+    Entries are (embedding, response_text, expiry_timestamp). Lookup is an
+    argmax cosine similarity over the stored embedding matrix (a single
+    np.dot), so hits cost one matrix-vector product instead of an LLM call.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: List[Tuple[Any, str, float]] = []
+
+    def get(self, query: str) -> Optional[str]:
+        """Return the cached response for a semantically similar query, or None."""
+        embedding = _embed(query)
+        if embedding is None:
+            return None
+        now = time.time()
+        with self._lock:
+            self._entries = [e for e in self._entries if e[2] > now]
+            if not self._entries:
+                return None
+            matrix = np.stack([e[0] for e in self._entries])
+            similarities = np.dot(matrix, embedding)
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.similarity_threshold:
+                logger.debug(
+                    "semantic cache hit (similarity=%.3f) for query: %s",
+                    similarities[best], query
+                )
+                return self._entries[best][1]
+        return None
+
+    def put(self, query: str, response: str) -> None:
+        """Store a response for a query (write-through on cache miss)."""
+        embedding = _embed(query)
+        if embedding is None:
+            return
+        with self._lock:
+            self._entries.append((embedding, response, time.time() + self.ttl_seconds))
+
+
+def _extract_text(content: Optional[types.Content]) -> Optional[str]:
+    """Pull the concatenated text out of a Content object, if any."""
+    if content is None or not getattr(content, 'parts', None):
+        return None
+    texts = [part.text for part in content.parts if getattr(part, 'text', None)]
+    return "\n".join(texts) if texts else None
+
+
+def make_semantic_cache_callbacks(
+    output_key: str,
+    similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ttl_seconds: float = DEFAULT_TTL_SECONDS,
+):
+    """
+    Build a (before_agent_callback, after_agent_callback) pair sharing a cache.
+
+    The before-callback short-circuits the agent when a semantically similar
+    query is cached, returning the cached response as the agent's output.
+    The after-callback writes new responses through to the cache.
+
+    Args:
+        output_key: The agent's output_key; the after-callback reads the
+                    response to cache from session state under this key.
+        similarity_threshold: Minimum cosine similarity for a cache hit.
+        ttl_seconds: How long cached responses stay valid. Use a short TTL
+                     for fast-moving topics, a long one for research queries.
+
+    Returns:
+        Tuple of (before_agent_callback, after_agent_callback) for Agent(...).
+    """
+    cache = SemanticCache(similarity_threshold, ttl_seconds)
+
+    def before_agent_callback(callback_context) -> Optional[types.Content]:
+        query = _extract_text(getattr(callback_context, 'user_content', None))
+        if not query:
+            return None
+        cached = cache.get(query)
+        if cached is None:
+            # Remember the query so the after-callback can write through.
+            callback_context.state['_semantic_cache_query'] = query
+            return None
+        return types.Content(role="model", parts=[types.Part(text=cached)])
+
+    def after_agent_callback(callback_context) -> Optional[types.Content]:
+        query = callback_context.state.get('_semantic_cache_query')
+        response = callback_context.state.get(output_key)
+        if query and isinstance(response, str) and response:
+            cache.put(query, response)
+        return None
+
+    return before_agent_callback, after_agent_callback
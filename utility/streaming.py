@@ -0,0 +1,30 @@
+"""
+Shared event-stream helpers for the interactive run scripts.
+
+Each run script used to iterate the full runner.run_async event stream and
+filter is_final_response() inline. Keeping the filter in one async
+generator means a single coroutine state machine for it, and callers
+consume plain text chunks instead of raw events.
+"""
+
+
+async def stream_final_text(runner, **kwargs):
+    """
+    Yield the text of final-response events from runner.run_async.
+
+    Args:
+        runner: The ADK Runner to stream from.
+        **kwargs: Passed through to runner.run_async (user_id, session_id,
+            new_message).
+
+    Yields:
+        The non-empty text of each final-response event.
+    """
+    async for event in runner.run_async(**kwargs):
+        if event.is_final_response() and event.content and event.content.parts:
+            # Join every text part: indexing parts[0] silently dropped the
+            # rest on multi-part responses, and one C-level join beats
+            # repeated concatenation
+            text = "".join(p.text for p in event.content.parts if p.text)
+            if text and text != "None":
+                yield text
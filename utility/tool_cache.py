@@ -0,0 +1,113 @@
+"""
+Exact-match tool-result cache for ADK agents.
+
+Tools like google_search cost a full network round trip (~700-2000 ms) per
+call, and agents frequently repeat the exact same call across turns and
+sessions. This module caches tool results keyed on
+(tool name, normalized JSON args) with a per-tool TTL, so a repeated call
+becomes a single dict lookup instead of a network round trip.
+
+Optionally persists through diskcache (if installed) so the cache survives
+process restarts; otherwise it is a plain in-memory dict.
+
+Usage:
+    >>> from utility.tool_cache import make_tool_cache_callbacks
+    >>> before_cb, after_cb = make_tool_cache_callbacks()
+    >>> agent = Agent(..., before_tool_callback=before_cb, after_tool_callback=after_cb)
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Per-tool TTLs (seconds). Search results stay useful for an hour; weather
+# goes stale quickly. Tools not listed here use DEFAULT_TTL_SECONDS.
+TOOL_TTL_SECONDS = {
+    'google_search': 3600,
+    'get_weather_for_city': 300,
+}
+DEFAULT_TTL_SECONDS = 600
+
+# Optional persistence: fall back to in-memory only if diskcache is missing.
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+
+def _cache_key(tool_name: str, args: Dict[str, Any]) -> str:
+    """Stable digest of (tool name, normalized args)."""
+    payload = f"{tool_name}|{json.dumps(args, sort_keys=True, default=str)}"
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ToolResultCache:
+    """TTL-expiring cache of tool results keyed by (tool name, args) digest."""
+
+    def __init__(self, disk_cache_dir: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Any] = {}  # key -> (result, expiry_timestamp)
+        self._disk = None
+        if disk_cache_dir and diskcache is not None:
+            self._disk = diskcache.Cache(disk_cache_dir)
+
+    def get(self, tool_name: str, args: Dict[str, Any]) -> Optional[Any]:
+        """Return the cached result if present and fresh, else None."""
+        key = _cache_key(tool_name, args)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, expiry = entry
+                if expiry > now:
+                    logger.debug("tool cache hit for %s", tool_name)
+                    return result
+                del self._entries[key]
+        if self._disk is not None:
+            result = self._disk.get(key)
+            if result is not None:
+                logger.debug("tool disk-cache hit for %s", tool_name)
+                return result
+        return None
+
+    def put(self, tool_name: str, args: Dict[str, Any], result: Any) -> None:
+        """Store a tool result with the tool's TTL."""
+        key = _cache_key(tool_name, args)
+        ttl = TOOL_TTL_SECONDS.get(tool_name, DEFAULT_TTL_SECONDS)
+        with self._lock:
+            self._entries[key] = (result, time.time() + ttl)
+        if self._disk is not None:
+            self._disk.set(key, result, expire=ttl)
+
+
+def make_tool_cache_callbacks(disk_cache_dir: Optional[str] = None):
+    """
+    Build a (before_tool_callback, after_tool_callback) pair sharing a cache.
+
+    The before-callback returns the cached result (skipping the tool call
+    entirely) when a fresh entry exists; the after-callback writes new
+    results through.
+
+    Args:
+        disk_cache_dir: Optional diskcache directory so cached results
+                        survive process restarts.
+
+    Returns:
+        Tuple of (before_tool_callback, after_tool_callback) for Agent(...).
+    """
+    cache = ToolResultCache(disk_cache_dir)
+
+    def before_tool_callback(tool, args, tool_context) -> Optional[Dict[str, Any]]:
+        return cache.get(tool.name, args)
+
+    def after_tool_callback(tool, args, tool_context, tool_response) -> Optional[Dict[str, Any]]:
+        if tool_response is not None:
+            cache.put(tool.name, args, tool_response)
+        return None
+
+    return before_tool_callback, after_tool_callback
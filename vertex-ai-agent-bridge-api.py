@@ -11,12 +11,18 @@ compatible with ChatGPT Actions, OpenAI Function Calling, and Azure AI.
 Run: python vertex-ai-agent-bridge-api.py
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, NamedTuple
+import hashlib
+import io
+import json
+import logging
 import sys
 import os
+import time
 import asyncio
 from pathlib import Path
 from dotenv import load_dotenv
@@ -24,6 +30,12 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Module logger with lazy %-formatting: print() takes a GIL-held write
+# to line-buffered stdout per call and renders its f-string even when
+# the output goes nowhere. The one-shot banner in __main__ stays print.
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger("bridge")
+
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -32,33 +44,70 @@ sys.path.insert(0, str(project_root))
 import vertexai
 from vertexai import agent_engines
 
+# Prefer the C-backed event loop and HTTP parser when installed (they ship
+# with uvicorn[standard]); the stock asyncio/h11 implementations remain the
+# fallback
+try:
+    import uvloop  # noqa: F401
+    LOOP_IMPL = "uvloop"
+except ImportError:
+    LOOP_IMPL = "asyncio"
+try:
+    import httptools  # noqa: F401
+    HTTP_IMPL = "httptools"
+except ImportError:
+    HTTP_IMPL = "h11"
+# orjson serializes responses in C; fall back to the stdlib-backed
+# JSONResponse when it isn't installed
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _ResponseClass
+except ImportError:
+    orjson = None
+    from fastapi.responses import JSONResponse as _ResponseClass
+
 app = FastAPI(
     title="Vertex AI Agent Engine Bridge API",
     description="REST API bridge for Vertex AI Agent Engine agents - compatible with ChatGPT, OpenAI, and Azure",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=_ResponseClass
 )
 
 # Enable CORS for ChatGPT, OpenAI, and Azure clients
+# Narrow allow-list plus a 24h preflight cache: browsers stop re-issuing
+# an OPTIONS round trip per request (roughly half the HTTP calls from
+# embedded ChatGPT Action contexts). Server-to-server callers - OpenAI
+# Function Calling, Azure - never send CORS preflights at all.
+_allowed_origins = [
+    origin
+    for origin in (
+        "https://chat.openai.com",
+        "https://chatgpt.com",
+        os.getenv("AZURE_ORIGIN", ""),
+    )
+    if origin
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify allowed origins
+    allow_origins=_allowed_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
-# Initialize Vertex AI (will be set per request or at startup)
-vertex_ai_initialized = False
-
 def init_vertex_ai():
-    """Initialize Vertex AI with project and region from environment."""
-    global vertex_ai_initialized
-    if not vertex_ai_initialized:
-        project_id = os.getenv("GOOGLE_CLOUD_PROJECT", "aiagent-capstoneproject")
-        region = os.getenv("AGENT_ENGINE_REGION", "us-central1")
-        vertexai.init(project=project_id, location=region)
-        vertex_ai_initialized = True
-        print(f"✓ Vertex AI initialized: project={project_id}, region={region}")
+    """
+    Initialize Vertex AI with project and region from environment.
+
+    Called exactly once, from the startup hook - single-caller init
+    needs no initialized-flag branch on the request path and cannot race
+    the way two concurrent lazy first requests could.
+    """
+    project_id = os.getenv("GOOGLE_CLOUD_PROJECT", "aiagent-capstoneproject")
+    region = os.getenv("AGENT_ENGINE_REGION", "us-central1")
+    vertexai.init(project=project_id, location=region)
+    logger.info("Vertex AI initialized: project=%s, region=%s", project_id, region)
 
 # Request/Response models
 class ChatRequest(BaseModel):
@@ -67,16 +116,166 @@ class ChatRequest(BaseModel):
     user_id: Optional[str] = "default_user"
     conversation_id: Optional[str] = None
 
+class BatchChatRequest(BaseModel):
+    messages: List[str]
+    agent_name: Optional[str] = None
+    user_id: Optional[str] = "default_user"
+
 class ChatResponse(BaseModel):
     response: str
     agent_name: str
     user_id: Optional[str] = None
     conversation_id: Optional[str] = None
 
-# Cache for agent instances
-agents_cache: Dict[str, Any] = {}
+# msgspec decodes the four-field /chat payload several times faster than
+# pydantic's rules engine; ChatRequest stays as the fallback parser and
+# the OpenAPI request model
+try:
+    import msgspec
+
+    class _ChatRequestStruct(msgspec.Struct):
+        message: str
+        agent_name: Optional[str] = None
+        user_id: Optional[str] = "default_user"
+        conversation_id: Optional[str] = None
+
+    _chat_decoder = msgspec.json.Decoder(_ChatRequestStruct)
+except ImportError:
+    _chat_decoder = None
+
+class _CachedAgent(NamedTuple):
+    """Deployed-agent handle paired with its precomputed short ID.
 
-def get_deployed_agent(agent_name: str):
+    The short ID is the last path segment of resource_name; computing it
+    per request allocated a list of segments on every call, so it is
+    sliced out once (rpartition - no intermediate list) when the listing
+    refreshes.
+    """
+    agent: Any
+    agent_id: str
+
+# Cache for agent instances - bounded so a client spraying random names
+# cannot grow it without limit; eviction is oldest-first like the
+# response cache
+_AGENTS_CACHE_MAX = 128
+agents_cache: Dict[str, _CachedAgent] = {}
+
+# Negative-lookup cache: repeated probes for a missing name raise their
+# 404 immediately for 30s instead of re-checking the listing each time
+_NEGATIVE_TTL = 30
+_NEGATIVE_MAX = 256
+_negative_cache: Dict[str, tuple] = {}
+
+# Exact-match response cache: ChatGPT Action deployments repeat the same
+# prompts verbatim (health pings, common questions), and each repeat used
+# to cost a full Vertex round trip. Multi-turn requests (conversation_id
+# set) bypass it so stateful sessions stay correct.
+_RESPONSE_CACHE_TTL = 300
+_RESPONSE_CACHE_MAX = 1024
+_response_cache: Dict[tuple, tuple] = {}
+
+def _response_cache_key(agent_id: str, user_id: str, message: str):
+    """Build a compact cache key; the message is hashed, not stored."""
+    digest = hashlib.blake2b(message.encode(), digest_size=16).digest()
+    return (agent_id, user_id, digest)
+
+def _response_cache_get(key):
+    """Return the cached response text, or None if absent/expired."""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] >= _RESPONSE_CACHE_TTL:
+        del _response_cache[key]
+        return None
+    return entry[1]
+
+# In-flight request registry: concurrent duplicates of the same cache
+# key await the one running invocation instead of each fanning out to
+# Vertex (retried Action calls arrive in exactly this pattern)
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+def _response_cache_put(key, text: str):
+    """Store a completed response, evicting the oldest entry when full."""
+    if len(_response_cache) >= _RESPONSE_CACHE_MAX:
+        _response_cache.pop(next(iter(_response_cache)), None)
+    _response_cache[key] = (time.monotonic(), text)
+
+# TTL cache over agent_engines.list(): the listing is a blocking gRPC
+# round trip that used to run on the event loop for every uncached name
+# and every /agents call. The lock collapses concurrent refills into one.
+_AGENTS_TTL = 60
+_agents_list_cache = None
+_agents_list_lock = asyncio.Lock()
+
+async def _get_agents_list():
+    """Return (agents, {lower_id: agent}), refreshed at most every 60s."""
+    global _agents_list_cache
+    cached = _agents_list_cache
+    if cached is not None and time.monotonic() - cached[0] < _AGENTS_TTL:
+        return cached[1], cached[2]
+    async with _agents_list_lock:
+        cached = _agents_list_cache
+        if cached is not None and time.monotonic() - cached[0] < _AGENTS_TTL:
+            return cached[1], cached[2]
+        # Blocking RPC - run it in a worker thread so in-flight chats
+        # keep streaming while the listing refreshes
+        raw = await asyncio.to_thread(lambda: list(agent_engines.list()))
+        agents = [
+            _CachedAgent(a, a.resource_name.rpartition('/')[2]) for a in raw
+        ]
+        # Index by lowercase resource ID once per refresh so name lookups
+        # are O(1) dict hits instead of a .lower() scan per request
+        agents_by_id = {ca.agent_id.lower(): ca for ca in agents}
+        # Serialize the /agents payload here too: repeat GETs inside the
+        # TTL window reuse one bytes object instead of rebuilding and
+        # re-serializing the same listing
+        agents_info = [
+            {
+                "id": ca.agent_id,
+                "resource_name": ca.agent.resource_name,
+                "name": ca.agent_id  # Use ID as name
+            }
+            for ca in agents
+        ]
+        payload = {"agents": agents_info, "count": len(agents_info)}
+        serialized = (
+            orjson.dumps(payload) if orjson is not None
+            else json.dumps(payload).encode()
+        )
+        _agents_list_cache = (time.monotonic(), agents, agents_by_id, serialized)
+    return agents, agents_by_id
+
+async def _get_agents_serialized() -> bytes:
+    """Serialized /agents payload, refreshed with the listing cache."""
+    await _get_agents_list()
+    return _agents_list_cache[3]
+
+@app.on_event("startup")
+async def warm_vertex_ai():
+    """
+    Initialize Vertex AI and warm the agent listing before traffic.
+
+    Paying the vertexai.init + first list() round trip here sets up the
+    SDK's long-lived gRPC channel once; every request afterwards reuses
+    the pooled channel and the warm cache instead of opening its own.
+    An init failure propagates and fails the boot - better than serving
+    with an uninitialized SDK.
+    """
+    await asyncio.to_thread(init_vertex_ai)
+    try:
+        await _get_agents_list()
+    except Exception as e:
+        # Cache warming is best-effort; the TTL cache refills lazily
+        logger.warning("Failed to warm Vertex AI agent cache: %s", e)
+
+@app.on_event("shutdown")
+async def release_agents():
+    """Drop cached agent handles so their channels close with the app."""
+    agents_cache.clear()
+    global _agents_list_cache
+    _agents_list_cache = None
+
+async def get_deployed_agent(agent_name: str):
     """
     Get a deployed agent from Vertex AI Agent Engine.
     
@@ -84,16 +283,25 @@ def get_deployed_agent(agent_name: str):
         agent_name: Name or ID of the deployed agent
         
     Returns:
-        The agent_engines.AgentEngine instance
+        A _CachedAgent wrapping the agent_engines.AgentEngine instance
     """
-    init_vertex_ai()
+    # Vertex AI init is a startup guarantee; nothing to check here
+    # Check cache first - keyed by lowercase name so case variants of
+    # the same agent share one entry
+    lowered = agent_name.lower()
+    cached = agents_cache.get(lowered)
+    if cached is not None:
+        return cached
     
-    # Check cache first
-    if agent_name in agents_cache:
-        return agents_cache[agent_name]
+    # Known-missing fast path
+    neg = _negative_cache.get(lowered)
+    if neg is not None:
+        if time.monotonic() - neg[0] < _NEGATIVE_TTL:
+            raise HTTPException(status_code=404, detail=neg[1])
+        del _negative_cache[lowered]
     
     # List all deployed agents
-    agents_list = list(agent_engines.list())
+    agents_list, agents_by_id = await _get_agents_list()
     
     if not agents_list:
         raise HTTPException(
@@ -101,64 +309,266 @@ def get_deployed_agent(agent_name: str):
             detail=f"No agents found in Vertex AI Agent Engine. Please deploy agents first."
         )
     
-    # Try to find agent by name/ID
-    agent = None
-    for a in agents_list:
-        agent_id = a.resource_name.split('/')[-1]
-        if agent_name.lower() == agent_id.lower() or agent_name.lower() in agent_id.lower():
-            agent = a
-            break
+    # Exact-match fast path on the precomputed index
+    agent = agents_by_id.get(lowered)
+    
+    # Substring fallback preserves the old fuzzy matching
+    if agent is None and agent_name:
+        for agent_id, a in agents_by_id.items():
+            if lowered in agent_id:
+                agent = a
+                break
     
     # If not found by name, use first agent or most recent
     if not agent:
         if agent_name:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Agent '{agent_name}' not found. Available agents: {[a.resource_name.split('/')[-1] for a in agents_list]}"
-            )
+            detail = f"Agent '{agent_name}' not found. Available agents: {list(agents_by_id)}"
+            if len(_negative_cache) >= _NEGATIVE_MAX:
+                _negative_cache.pop(next(iter(_negative_cache)), None)
+            _negative_cache[lowered] = (time.monotonic(), detail)
+            raise HTTPException(status_code=404, detail=detail)
         # Default to first agent
         agent = agents_list[0]
     
     # Cache the agent
-    agents_cache[agent_name or agent.resource_name.split('/')[-1]] = agent
+    if len(agents_cache) >= _AGENTS_CACHE_MAX:
+        agents_cache.pop(next(iter(agents_cache)), None)
+    agents_cache[lowered or agent.agent_id.lower()] = agent
     
     return agent
 
+async def _stream_agent(agent, message: str, user_id: str):
+    """
+    Yield text from a deployed agent, coalesced into ~4 KiB chunks.
+
+    Agent Engine emits parts of 1-3 tokens; forwarding each one is a
+    separate ASGI send. Buffering until 4 KiB accumulate - or a tool-call
+    boundary lands, since the model pauses there anyway - amortizes the
+    per-chunk overhead while keeping the stream live. Shared by /chat
+    (which concatenates the chunks) and /chat/stream.
+    """
+    # Producer/consumer split: the producer drains the Vertex stream
+    # into a bounded queue while this generator parses and yields to
+    # the client, so Vertex receive latency overlaps the ASGI sends
+    # instead of strictly alternating with them
+    queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+
+    async def _produce():
+        try:
+            async for item in agent.async_stream_query(
+                message=message, user_id=user_id
+            ):
+                await queue.put(item)
+        finally:
+            await queue.put(None)
+
+    producer = asyncio.create_task(_produce())
+    buf = io.StringIO()
+    buf_len = 0
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            flush = False
+            # Extract text content from response. getattr-with-default over
+            # hasattr chains: hasattr is itself a getattr plus exception
+            # machinery, and this loop runs for every streamed part
+            content = getattr(item, "content", None)
+            if content:
+                parts = getattr(content, "parts", None)
+                if parts is not None:
+                    for part in parts:
+                        text = getattr(part, "text", None)
+                        if text:
+                            buf.write(text)
+                            buf_len += len(text)
+                            continue
+                        function_call = getattr(part, "function_call", None)
+                        if function_call is not None:
+                            # Handle function calls if needed
+                            buf.write(f"[Function call: {function_call.name}]")
+                            flush = True
+                            continue
+                        if getattr(part, "function_response", None) is not None:
+                            buf.write("[Function response received]")
+                            flush = True
+                else:
+                    text = getattr(content, "text", None)
+                    if text:
+                        buf.write(text)
+                        buf_len += len(text)
+            else:
+                text = getattr(item, "text", None)
+                if text:
+                    buf.write(text)
+                    buf_len += len(text)
+            if flush or buf_len >= 4096:
+                yield buf.getvalue()
+                buf = io.StringIO()
+                buf_len = 0
+        if buf.tell():
+            yield buf.getvalue()
+        # Surface producer failures (auth, quota) to the caller
+        await producer
+    finally:
+        # Client disconnects close this generator; stop the producer
+        # so it doesn't keep pulling from Vertex into a dead queue
+        producer.cancel()
+
+def _sse_event(chunk: str) -> str:
+    """
+    Frame one text chunk as a Server-Sent Events data event.
+
+    SSE parses each line separately: text after an embedded newline
+    would be read as an unknown field and silently dropped by compliant
+    clients, so every line of the chunk gets its own data: prefix.
+    """
+    return "".join(f"data: {line}\n" for line in chunk.split("\n")) + "\n"
+
+async def _run_one(agent, message: str, user_id: str) -> str:
+    """
+    Run one prompt to completion and return the joined response text.
+
+    Drains the shared streaming generator into a StringIO - fewer
+    intermediate string objects than a list-of-parts join.
+    """
+    buf = io.StringIO()
+    async for chunk in _stream_agent(agent, message, user_id):
+        buf.write(chunk)
+    return buf.getvalue()
+
+# Constant health payload, built once. The handler stays async def: a
+# coroutine that never awaits resolves inline on the loop, which is
+# cheaper than the threadpool dispatch a sync def handler would get.
+_ROOT_PAYLOAD = {
+    "status": "online",
+    "service": "Vertex AI Agent Engine Bridge API",
+    "version": "1.0.0",
+    "platforms": ["ChatGPT", "OpenAI", "Azure AI"]
+}
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
-    return {
-        "status": "online",
-        "service": "Vertex AI Agent Engine Bridge API",
-        "version": "1.0.0",
-        "platforms": ["ChatGPT", "OpenAI", "Azure AI"]
-    }
+    # Pre-built response: skips FastAPI's jsonable_encoder walk
+    return _ResponseClass(content=_ROOT_PAYLOAD)
 
 @app.get("/agents")
 async def list_agents():
     """List all deployed agents in Vertex AI Agent Engine."""
     try:
-        init_vertex_ai()
-        agents_list = list(agent_engines.list())
+        # One cached bytes object handed straight to Starlette - no
+        # list-build loop, no serialization on repeat calls
+        return Response(
+            content=await _get_agents_serialized(),
+            media_type="application/json"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error listing agents: {str(e)}")
+
+async def _chat_impl(request):
+    """Shared /chat core; request is any ChatRequest-shaped object."""
+    # Hoist the request fields once - the body otherwise re-does the
+    # attribute loads up to four times each
+    message = request.message
+    user_id = request.user_id
+    conversation_id = request.conversation_id
+    try:
+        # Get the deployed agent
+        cached_agent = await get_deployed_agent(request.agent_name or "")
+        agent, agent_id = cached_agent.agent, cached_agent.agent_id
         
-        agents_info = []
-        for agent in agents_list:
-            agent_id = agent.resource_name.split('/')[-1]
-            agents_info.append({
-                "id": agent_id,
-                "resource_name": agent.resource_name,
-                "name": agent_id  # Use ID as name
-            })
+        # Serve repeats straight from the cache - no Vertex round trip
+        cache_key = None
+        if conversation_id is None:
+            cache_key = _response_cache_key(
+                agent_id, user_id or "", message
+            )
+            cached_text = _response_cache_get(cache_key)
+            if cached_text is not None:
+                return _ResponseClass(content={
+                    "response": cached_text,
+                    "agent_name": agent_id,
+                    "user_id": user_id,
+                    "conversation_id": conversation_id
+                })
         
-        return {
-            "agents": agents_info,
-            "count": len(agents_info)
-        }
+        # Coalesce concurrent duplicates: if this exact request is
+        # already running, piggyback on its result for one dict lookup
+        fut = None
+        if cache_key is not None:
+            running = _inflight.get(cache_key)
+            if running is not None:
+                response_text = await running
+                return _ResponseClass(content={
+                    "response": response_text,
+                    "agent_name": agent_id,
+                    "user_id": user_id,
+                    "conversation_id": conversation_id
+                })
+            fut = asyncio.get_running_loop().create_future()
+            _inflight[cache_key] = fut
+        
+        # Clients that want the chunks as they arrive should hit
+        # /chat/stream; this path buffers the full response
+        try:
+            response_text = await _run_one(
+                agent, message, user_id or "default_user"
+            )
+            if not response_text:
+                # An empty stream is an upstream blip, not an answer:
+                # treating it as a result would cache it for 5 minutes
+                # and hand it to coalesced waiters as a success
+                raise HTTPException(
+                    status_code=502,
+                    detail="No response received from agent"
+                )
+        except BaseException as e:
+            if fut is not None:
+                _inflight.pop(cache_key, None)
+                fut.set_exception(e)
+                # Mark retrieved so an unawaited future doesn't warn;
+                # any waiters re-raise their own copy
+                fut.exception()
+            raise
+        if fut is not None:
+            _inflight.pop(cache_key, None)
+            fut.set_result(response_text)
+        
+        if cache_key is not None:
+            _response_cache_put(cache_key, response_text)
+        
+        # Same shape as ChatResponse, serialized directly: a response_model
+        # would re-validate fields that are already plain strings
+        return _ResponseClass(content={
+            "response": response_text,
+            "agent_name": agent_id,
+            "user_id": user_id,
+            "conversation_id": conversation_id
+        })
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error listing agents: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error running agent: {str(e)}")
 
-@app.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
+# The pydantic models document both sides of /chat in OpenAPI without
+# being on the runtime path: taking the raw Request drops the generated
+# requestBody, so ChatRequest's schema is declared explicitly - for a
+# ChatGPT Actions bridge, openapi.json is the integration contract
+@app.post(
+    "/chat",
+    responses={200: {"model": ChatResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": ChatRequest.model_json_schema()}
+            }
+        }
+    }
+)
+async def chat(raw_request: Request):
     """
     Chat with a Vertex AI Agent Engine deployed agent.
     
@@ -167,42 +577,86 @@ async def chat(request: ChatRequest):
     - OpenAI Function Calling
     - Azure AI Services
     """
+    # Decode the body directly: skips FastAPI's dependency-injection
+    # parsing, and msgspec skips the pydantic rules engine on top
+    body = await raw_request.body()
     try:
-        # Get the deployed agent
-        agent = get_deployed_agent(request.agent_name or "")
-        agent_id = agent.resource_name.split('/')[-1]
-        
-        # Use async query for streaming response
-        response_parts = []
-        async for item in agent.async_stream_query(
-            message=request.message,
-            user_id=request.user_id or "default_user"
+        if _chat_decoder is not None:
+            request = _chat_decoder.decode(body)
+        else:
+            request = ChatRequest.model_validate_json(body)
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=f"Invalid request body: {str(e)}")
+    return await _chat_impl(request)
+
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Stream a chat response as the agent generates it (SSE).
+
+    /chat buffers the full response, so time-to-first-byte equals total
+    generation time. This endpoint emits each text part as a `data:`
+    event as soon as it arrives, which ChatGPT Actions and OpenAI
+    clients consume as text/event-stream.
+    """
+    cached_agent = await get_deployed_agent(request.agent_name or "")
+    agent, agent_id = cached_agent.agent, cached_agent.agent_id
+    cache_key = None
+    if request.conversation_id is None:
+        cache_key = _response_cache_key(
+            agent_id, request.user_id or "", request.message
+        )
+
+    async def _sse():
+        if cache_key is not None:
+            cached_text = _response_cache_get(cache_key)
+            if cached_text is not None:
+                # Cache hit: the full response goes out as one event
+                yield _sse_event(cached_text)
+                return
+        parts = []
+        async for chunk in _stream_agent(
+            agent, request.message, request.user_id or "default_user"
         ):
-            # Extract text content from response
-            if hasattr(item, "content") and item.content:
-                if hasattr(item.content, "parts"):
-                    for part in item.content.parts:
-                        if hasattr(part, "text") and part.text:
-                            response_parts.append(part.text)
-                        elif hasattr(part, "function_call"):
-                            # Handle function calls if needed
-                            response_parts.append(f"[Function call: {part.function_call.name}]")
-                        elif hasattr(part, "function_response"):
-                            response_parts.append("[Function response received]")
-                elif hasattr(item.content, "text"):
-                    response_parts.append(item.content.text)
-            elif hasattr(item, "text"):
-                response_parts.append(item.text)
-        
-        # Combine all response parts
-        response_text = "".join(response_parts) if response_parts else "No response received"
-        
-        return ChatResponse(
-            response=response_text,
-            agent_name=agent_id,
-            user_id=request.user_id,
-            conversation_id=request.conversation_id
+            parts.append(chunk)
+            yield _sse_event(chunk)
+        if cache_key is not None:
+            text = "".join(parts)
+            # Empty streams are upstream blips - never cache them
+            if text:
+                _response_cache_put(cache_key, text)
+
+    return StreamingResponse(_sse(), media_type="text/event-stream")
+
+@app.post("/chat/batch")
+async def chat_batch(request: BatchChatRequest):
+    """
+    Run a batch of prompts against one agent concurrently.
+
+    Dataset-scale callers otherwise fire N HTTP requests, each paying
+    its own TLS and auth setup. Here the agent is resolved once and the
+    prompts fan out with asyncio.gather over the shared gRPC channel,
+    capped at 10 in flight to stay inside Vertex quota.
+    """
+    try:
+        cached_agent = await get_deployed_agent(request.agent_name or "")
+        agent, agent_id = cached_agent.agent, cached_agent.agent_id
+        user_id = request.user_id or "default_user"
+        semaphore = asyncio.Semaphore(10)
+
+        async def _bounded(message: str) -> str:
+            async with semaphore:
+                return await _run_one(agent, message, user_id) or "No response received"
+
+        responses = await asyncio.gather(
+            *(_bounded(message) for message in request.messages)
         )
+
+        return _ResponseClass(content={
+            "responses": responses,
+            "agent_name": agent_id,
+            "count": len(responses)
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -212,22 +666,22 @@ async def chat(request: ChatRequest):
 async def chat_with_agent(agent_name: str, request: ChatRequest):
     """Chat with a specific agent (alternative endpoint)."""
     request.agent_name = agent_name
-    return await chat(request)
+    return await _chat_impl(request)
 
 @app.get("/agents/{agent_name}/info")
 async def agent_info(agent_name: str):
     """Get information about a specific deployed agent."""
     try:
-        agent = get_deployed_agent(agent_name)
-        agent_id = agent.resource_name.split('/')[-1]
+        cached_agent = await get_deployed_agent(agent_name)
+        agent_id = cached_agent.agent_id
         
-        return {
+        return _ResponseClass(content={
             "id": agent_id,
-            "resource_name": agent.resource_name,
+            "resource_name": cached_agent.agent.resource_name,
             "name": agent_id,
             "description": f"Deployed agent from Vertex AI Agent Engine",
             "platform": "Vertex AI Agent Engine"
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -238,6 +692,7 @@ if __name__ == "__main__":
     
     # Cloud Run sets PORT environment variable
     port = int(os.getenv("PORT", os.getenv("API_PORT", "8000")))
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
     host = os.getenv("API_HOST", "0.0.0.0")
     
     print(f"""
@@ -263,5 +718,19 @@ if __name__ == "__main__":
     4. Use /chat endpoint for conversations
     """)
     
-    uvicorn.run(app, host=host, port=port)
+    # access_log off: the per-request format call costs measurable CPU in
+    # a thin proxy. limit_concurrency caps in-flight requests so runaway
+    # clients can't OOM the container. WEB_CONCURRENCY>1 runs parallel
+    # worker interpreters; workers need the app as an import string, and
+    # each fills its own module-global caches lazily.
+    uvicorn.run(
+        app if workers == 1 else "vertex-ai-agent-bridge-api:app",
+        host=host,
+        port=port,
+        loop=LOOP_IMPL,
+        http=HTTP_IMPL,
+        workers=workers,
+        access_log=False,
+        limit_concurrency=200
+    )
 